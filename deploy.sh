@@ -187,5 +187,8 @@ echo "Reel API endpoints:"
 echo "  GET  /api/v1/reel/logs           - List logs (paginated, filtered)"
 echo "  GET  /api/v1/reel/logs/{id}      - Get single log entry"
 echo "  GET  /api/v1/reel/logs/stats     - Log statistics"
-echo "  POST /api/v1/reel/logs/export    - Export logs to file"
+echo "  POST /api/v1/reel/logs/export    - Export logs to file (streamed)"
+echo "  POST /api/v1/reel/logs/export/prepare - Export metadata"
+echo "  GET  /api/v1/reel/logs/export/{job_id} - Background export status"
+echo "  GET  /api/v1/reel/logs/export/{job_id}/download - Download background export"
 echo "  POST /api/v1/reel/logs           - Create log (internal)"
@@ -6,13 +6,19 @@ Exports:
     - router: FastAPI router for /api/v1/reel/*
     - ReelService: Core logging service
     - get_reel_service: FastAPI dependency
+    - start_log_writer / stop_log_writer: Batched insert worker lifecycle
+    - start_export_jobs / stop_export_jobs: Background export job lifecycle
+    - ReelRequestMetaMiddleware: Request metadata and correlation ID middleware
     - LogEntry: SQLAlchemy model
     - LogSeverity: Log severity enum
 """
 
 from .router import router
+from .middleware import ReelRequestMetaMiddleware
 from .models.log_entry import LogEntry, LogSeverity
 from .services.reel_service import ReelService, get_reel_service
+from .services.log_writer import start_log_writer, stop_log_writer
+from .services.export_jobs import start_export_jobs, stop_export_jobs
 
 __all__ = [
     "router",
@@ -20,4 +26,9 @@ __all__ = [
     "LogSeverity",
     "ReelService",
     "get_reel_service",
+    "start_log_writer",
+    "stop_log_writer",
+    "start_export_jobs",
+    "stop_export_jobs",
+    "ReelRequestMetaMiddleware",
 ]
@@ -8,7 +8,8 @@ REEL manages audit logging and provides log viewing, filtering, and export capab
 """
 
 import logging
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +44,29 @@ REEL_ACTIONS: List[Dict[str, Any]] = [
     },
 ]
 
+# Action codes are fixed at import time
+_REEL_ACTION_CODES: Tuple[str, ...] = tuple(
+    f"reel.{action['resource']}.{action['operation']}"
+    for action in REEL_ACTIONS
+)
+
+
+@lru_cache(maxsize=None)
+def _reel_action_scopes() -> Tuple[Tuple[Any, ...], ...]:
+    """
+    Valid scopes of each REEL action (in REEL_ACTIONS order) as ActionScope enums.
+
+    Cached after the first successful call. Raises ImportError if MENTOR
+    is unavailable (failures are not cached).
+    """
+    # This import is done here to avoid circular dependencies
+    from src.modules.mentor import ActionScope
+
+    return tuple(
+        tuple(ActionScope(s) for s in action["valid_scopes"])
+        for action in REEL_ACTIONS
+    )
+
 
 def register_reel_actions():
     """
@@ -57,21 +81,15 @@ def register_reel_actions():
     try:
         # Import from MENTOR to access the action registry
         # This import is done here to avoid circular dependencies
-        from src.modules.mentor import (
-            get_action_registry,
-            ActionScope,
-        )
+        from src.modules.mentor import get_action_registry
 
         registry = get_action_registry()
 
-        # Convert scope strings to ActionScope enums
-        actions_with_scopes = []
-        for action in REEL_ACTIONS:
-            action_copy = action.copy()
-            action_copy["valid_scopes"] = [
-                ActionScope(s) for s in action["valid_scopes"]
-            ]
-            actions_with_scopes.append(action_copy)
+        # Plain dicts for the registry, with the cached ActionScope enums
+        actions_with_scopes = [
+            {**action, "valid_scopes": list(scopes)}
+            for action, scopes in zip(REEL_ACTIONS, _reel_action_scopes())
+        ]
 
         registered = registry.register_module_actions(
             module="reel",
@@ -102,7 +120,4 @@ def get_reel_action_codes() -> List[str]:
     Returns:
         List of action codes (e.g., ['reel.logs.view', 'reel.logs.export'])
     """
-    return [
-        f"reel.{action['resource']}.{action['operation']}"
-        for action in REEL_ACTIONS
-    ]
+    return list(_REEL_ACTION_CODES)
@@ -0,0 +1,39 @@
+"""Add GIN index on reel log entry data payload
+
+Revision ID: 20250214_000001
+Revises: 20250213_000001
+Create Date: 2025-02-14
+
+Adds a jsonb_path_ops GIN index on reel_log_entries.data so that payload
+searches using the @> containment operator avoid sequential scans.
+
+Dependencies: Reel log entries migration (20250213_000001)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20250214_000001'
+down_revision: Union[str, None] = '20250213_000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ============================================================================
+    # INDEXES: Payload containment search
+    # ============================================================================
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_reel_data_gin
+            ON reel_log_entries USING GIN (data jsonb_path_ops)
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_reel_data_gin")
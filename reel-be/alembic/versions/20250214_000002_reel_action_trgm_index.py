@@ -0,0 +1,50 @@
+"""Add trigram index for reel action wildcard filters
+
+Revision ID: 20250214_000002
+Revises: 20250214_000001
+Create Date: 2025-02-14
+
+Adds a tenant-scoped pg_trgm GIN index on reel_log_entries.action so that
+wildcard action filters ('users.*', '*.login') avoid scanning every tenant row.
+The btree composite idx_reel_tenant_module_action still serves exact matches.
+
+Dependencies: Reel data GIN index migration (20250214_000001)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20250214_000002'
+down_revision: Union[str, None] = '20250214_000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ============================================================================
+    # EXTENSIONS
+    # ============================================================================
+
+    # pg_trgm provides gin_trgm_ops; btree_gin lets tenant_id (UUID) share the GIN index
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+
+    # ============================================================================
+    # INDEXES: Wildcard action filtering
+    # ============================================================================
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_reel_tenant_action_trgm
+            ON reel_log_entries USING GIN (tenant_id, action gin_trgm_ops)
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_reel_tenant_action_trgm")
+
+    # Extensions are left installed; other modules may depend on them
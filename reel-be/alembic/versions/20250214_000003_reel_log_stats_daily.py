@@ -0,0 +1,62 @@
+"""Create reel daily log statistics rollup
+
+Revision ID: 20250214_000003
+Revises: 20250214_000002
+Create Date: 2025-02-14
+
+Creates the reel_log_stats_daily table, a per-tenant rollup of entry counts
+by day, module and severity. Statistics read from it instead of running
+COUNT(*) over reel_log_entries. Existing entries are backfilled.
+
+Dependencies: Reel action trigram index migration (20250214_000002)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20250214_000003'
+down_revision: Union[str, None] = '20250214_000002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ============================================================================
+    # REEL LOG STATS DAILY: Rollup counters for statistics
+    # ============================================================================
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS reel_log_stats_daily (
+            tenant_id UUID NOT NULL,
+            day DATE NOT NULL,
+            module VARCHAR(100) NOT NULL,
+            severity log_severity_enum NOT NULL,
+            count BIGINT NOT NULL DEFAULT 0,
+
+            PRIMARY KEY (tenant_id, day, module, severity)
+        )
+    """)
+
+    # ============================================================================
+    # BACKFILL: Roll up existing entries
+    # ============================================================================
+    op.execute("""
+        INSERT INTO reel_log_stats_daily (tenant_id, day, module, severity, count)
+        SELECT tenant_id, (created_at AT TIME ZONE 'UTC')::date, module, severity, COUNT(*)
+        FROM reel_log_entries
+        GROUP BY 1, 2, 3, 4
+        ON CONFLICT (tenant_id, day, module, severity)
+        DO UPDATE SET count = EXCLUDED.count
+    """)
+
+    # ============================================================================
+    # COMMENTS: Documentation
+    # ============================================================================
+    op.execute("COMMENT ON TABLE reel_log_stats_daily IS 'Daily per-tenant rollup of reel_log_entries counts'")
+    op.execute("COMMENT ON COLUMN reel_log_stats_daily.day IS 'UTC day the entries were created'")
+    op.execute("COMMENT ON COLUMN reel_log_stats_daily.count IS 'Number of entries in this bucket'")
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS reel_log_stats_daily")
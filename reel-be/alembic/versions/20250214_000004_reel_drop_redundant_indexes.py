@@ -0,0 +1,49 @@
+"""Drop redundant single-column reel indexes
+
+Revision ID: 20250214_000004
+Revises: 20250214_000003
+Create Date: 2025-02-14
+
+Drops the auto-named single-column indexes that the LogEntry model used to
+declare with index=True. Tenant-scoped queries are served by the tenant-first
+composite indexes, request_id by the partial idx_reel_request_id and module by
+idx_reel_module, so these only added write amplification on every insert.
+
+The baseline migration never created them; they exist only on databases built
+from the model metadata, hence IF EXISTS.
+
+Dependencies: Reel daily stats migration (20250214_000003)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20250214_000004'
+down_revision: Union[str, None] = '20250214_000003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+REDUNDANT_INDEXES = [
+    "ix_reel_log_entries_actor_id",
+    "ix_reel_log_entries_tenant_id",
+    "ix_reel_log_entries_client_id",
+    "ix_reel_log_entries_module",
+    "ix_reel_log_entries_action",
+    "ix_reel_log_entries_severity",
+    "ix_reel_log_entries_request_id",
+    "ix_reel_log_entries_created_at",
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for index_name in REDUNDANT_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+
+
+def downgrade() -> None:
+    # Nothing to restore: the baseline schema (20250213_000001) never had these indexes
+    pass
@@ -0,0 +1,201 @@
+"""Partition reel log entries by month
+
+Revision ID: 20250214_000005
+Revises: 20250214_000004
+Create Date: 2025-02-14
+
+Rebuilds reel_log_entries as a table range-partitioned on created_at with one
+partition per month (reel_log_entries_YYYY_MM). Retention then drops whole
+partitions instead of running a mass DELETE, and time-bounded queries only
+touch the months they cover.
+
+- The primary key becomes (id, created_at), as partitioning requires
+- reel_ensure_log_partitions(months_ahead) creates missing monthly partitions
+  from the current month forward; run it on a schedule (ReelService.ensure_partitions)
+- A DEFAULT partition catches rows outside the created months. When a
+  month's partition is created later, its rows are moved out of the default
+  partition first (otherwise the new bound would be violated); the default
+  partition is locked only while those rows are moved
+
+Existing rows are copied into the new table. This holds an exclusive lock on
+reel_log_entries for the duration of the copy; schedule it in a maintenance window.
+
+Dependencies: Reel redundant index cleanup migration (20250214_000004)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20250214_000005'
+down_revision: Union[str, None] = '20250214_000004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Indexes on reel_log_entries (created on the partitioned parent, cascade to partitions)
+INDEXES = [
+    # Tenant log queries (most common)
+    "CREATE INDEX IF NOT EXISTS idx_reel_tenant_created ON reel_log_entries(tenant_id, created_at DESC)",
+    # Client log queries
+    "CREATE INDEX IF NOT EXISTS idx_reel_tenant_client_created ON reel_log_entries(tenant_id, client_id, created_at DESC)",
+    # Action filtering
+    "CREATE INDEX IF NOT EXISTS idx_reel_tenant_module_action ON reel_log_entries(tenant_id, module, action)",
+    # Wildcard action filtering
+    "CREATE INDEX IF NOT EXISTS idx_reel_tenant_action_trgm ON reel_log_entries USING GIN (tenant_id, action gin_trgm_ops)",
+    # User activity lookup
+    "CREATE INDEX IF NOT EXISTS idx_reel_tenant_actor ON reel_log_entries(tenant_id, actor_id)",
+    # Severity filtering
+    "CREATE INDEX IF NOT EXISTS idx_reel_tenant_severity ON reel_log_entries(tenant_id, severity, created_at DESC)",
+    # Request correlation
+    "CREATE INDEX IF NOT EXISTS idx_reel_request_id ON reel_log_entries(request_id) WHERE request_id IS NOT NULL",
+    # Module index for cross-tenant analytics (admin only)
+    "CREATE INDEX IF NOT EXISTS idx_reel_module ON reel_log_entries(module)",
+    # Payload containment search
+    "CREATE INDEX IF NOT EXISTS idx_reel_data_gin ON reel_log_entries USING GIN (data jsonb_path_ops)",
+]
+
+
+def upgrade() -> None:
+    # ============================================================================
+    # PARTITIONED TABLE: Same columns, PK extended with the partition key
+    # ============================================================================
+    op.execute("ALTER TABLE reel_log_entries RENAME TO reel_log_entries_legacy")
+    op.execute("ALTER TABLE reel_log_entries_legacy RENAME CONSTRAINT reel_log_entries_pkey TO reel_log_entries_legacy_pkey")
+
+    op.execute("""
+        CREATE TABLE reel_log_entries (
+            LIKE reel_log_entries_legacy
+                INCLUDING DEFAULTS INCLUDING COMMENTS INCLUDING STORAGE,
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+
+    # ============================================================================
+    # PARTITION MAINTENANCE: Monthly create-ahead
+    # ============================================================================
+    op.execute("""
+        CREATE OR REPLACE FUNCTION reel_ensure_log_partitions(
+            months_ahead INT DEFAULT 3,
+            from_month TIMESTAMPTZ DEFAULT NULL
+        ) RETURNS INT
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            first_month TIMESTAMP := date_trunc('month', COALESCE(from_month, now()) AT TIME ZONE 'UTC');
+            last_month TIMESTAMP := date_trunc('month', now() AT TIME ZONE 'UTC')
+                + make_interval(months => months_ahead);
+            months TIMESTAMP[] := ARRAY(
+                SELECT generate_series(first_month, last_month, interval '1 month')
+            );
+            stray_months TIMESTAMP[];
+            month_start TIMESTAMP;
+            partition_name TEXT;
+            range_start TIMESTAMPTZ;
+            range_end TIMESTAMPTZ;
+            has_stray_rows BOOLEAN;
+            created_count INT := 0;
+        BEGIN
+            -- Months that only exist in the default partition (e.g. create-ahead
+            -- did not run in time) get their partition too, whatever from_month is
+            IF to_regclass('reel_log_entries_default') IS NOT NULL THEN
+                EXECUTE 'SELECT array_agg(DISTINCT date_trunc(''month'', created_at AT TIME ZONE ''UTC''))
+                         FROM reel_log_entries_default'
+                    INTO stray_months;
+                months := stray_months || months;
+            END IF;
+
+            FOREACH month_start IN ARRAY months LOOP
+                partition_name := 'reel_log_entries_' || to_char(month_start, 'YYYY_MM');
+                range_start := month_start AT TIME ZONE 'UTC';
+                range_end := (month_start + interval '1 month') AT TIME ZONE 'UTC';
+
+                IF to_regclass(partition_name) IS NULL THEN
+                    has_stray_rows := FALSE;
+                    IF to_regclass('reel_log_entries_default') IS NOT NULL THEN
+                        EXECUTE 'SELECT EXISTS (SELECT 1 FROM reel_log_entries_default
+                                 WHERE created_at >= $1 AND created_at < $2)'
+                            INTO has_stray_rows
+                            USING range_start, range_end;
+                    END IF;
+
+                    -- Rows of this month in the default partition would violate
+                    -- the new partition's bound: park them while it is created
+                    IF has_stray_rows THEN
+                        EXECUTE 'CREATE TEMP TABLE reel_stray_log_entries (LIKE reel_log_entries)';
+                        EXECUTE 'WITH moved AS (
+                                     DELETE FROM reel_log_entries_default
+                                     WHERE created_at >= $1 AND created_at < $2
+                                     RETURNING *
+                                 )
+                                 INSERT INTO reel_stray_log_entries SELECT * FROM moved'
+                            USING range_start, range_end;
+                    END IF;
+
+                    EXECUTE format(
+                        'CREATE TABLE %I PARTITION OF reel_log_entries FOR VALUES FROM (%L) TO (%L)',
+                        partition_name,
+                        range_start,
+                        range_end
+                    );
+
+                    IF has_stray_rows THEN
+                        EXECUTE 'INSERT INTO reel_log_entries SELECT * FROM reel_stray_log_entries';
+                        EXECUTE 'DROP TABLE reel_stray_log_entries';
+                    END IF;
+
+                    created_count := created_count + 1;
+                END IF;
+            END LOOP;
+            RETURN created_count;
+        END $$
+    """)
+
+    # Cover existing data plus the next three months
+    op.execute("""
+        SELECT reel_ensure_log_partitions(
+            3,
+            (SELECT COALESCE(MIN(created_at), now()) FROM reel_log_entries_legacy)
+        )
+    """)
+
+    # Safety net for rows outside the created months
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS reel_log_entries_default
+        PARTITION OF reel_log_entries DEFAULT
+    """)
+
+    # ============================================================================
+    # DATA: Copy existing entries, then drop the legacy table (and its indexes)
+    # ============================================================================
+    op.execute("INSERT INTO reel_log_entries SELECT * FROM reel_log_entries_legacy")
+    op.execute("DROP TABLE reel_log_entries_legacy")
+
+    # ============================================================================
+    # INDEXES: Recreated on the partitioned parent
+    # ============================================================================
+    for index_sql in INDEXES:
+        op.execute(index_sql)
+
+    op.execute("COMMENT ON TABLE reel_log_entries IS 'Audit log entries for all module actions (partitioned monthly by created_at)'")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE reel_log_entries RENAME TO reel_log_entries_partitioned")
+    op.execute("ALTER TABLE reel_log_entries_partitioned RENAME CONSTRAINT reel_log_entries_pkey TO reel_log_entries_partitioned_pkey")
+
+    op.execute("""
+        CREATE TABLE reel_log_entries (
+            LIKE reel_log_entries_partitioned
+                INCLUDING DEFAULTS INCLUDING COMMENTS INCLUDING STORAGE,
+            PRIMARY KEY (id)
+        )
+    """)
+
+    op.execute("INSERT INTO reel_log_entries SELECT * FROM reel_log_entries_partitioned")
+    op.execute("DROP TABLE reel_log_entries_partitioned CASCADE")
+    op.execute("DROP FUNCTION IF EXISTS reel_ensure_log_partitions(INT, TIMESTAMPTZ)")
+
+    for index_sql in INDEXES:
+        op.execute(index_sql)
+
+    op.execute("COMMENT ON TABLE reel_log_entries IS 'Audit log entries for all module actions'")
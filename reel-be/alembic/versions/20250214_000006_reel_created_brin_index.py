@@ -0,0 +1,41 @@
+"""Add BRIN index on reel log entry created_at
+
+Revision ID: 20250214_000006
+Revises: 20250214_000005
+Create Date: 2025-02-14
+
+Adds a BRIN summary index on reel_log_entries.created_at for cross-tenant
+time-range scans (retention cleanup, admin analytics). Entries are inserted in
+time order, so block ranges map tightly to time ranges and the index stays a
+tiny fraction of a B-tree's size. Tenant-scoped queries keep using
+idx_reel_tenant_created.
+
+Dependencies: Reel partitioning migration (20250214_000005)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20250214_000006'
+down_revision: Union[str, None] = '20250214_000005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ============================================================================
+    # INDEXES: Time-range scans
+    # ============================================================================
+
+    # Created on the partitioned parent (CONCURRENTLY is not supported there)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_reel_created_brin
+        ON reel_log_entries USING BRIN (created_at)
+        WITH (pages_per_range = 32)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_reel_created_brin")
@@ -0,0 +1,53 @@
+"""Compress reel log entry payloads with lz4
+
+Revision ID: 20250214_000007
+Revises: 20250214_000006
+Create Date: 2025-02-14
+
+Switches TOAST compression of reel_log_entries.data from pglz to lz4, which
+decompresses several times faster at a similar ratio. Requires PostgreSQL 14+
+built with lz4; on other servers the change is skipped with a notice.
+
+Only newly written values use lz4. Existing rows keep pglz until rewritten;
+to recompress old partitions, run VACUUM FULL on each partition (e.g.
+VACUUM FULL reel_log_entries_2025_01) in a maintenance window.
+
+Dependencies: Reel BRIN index migration (20250214_000006)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20250214_000007'
+down_revision: Union[str, None] = '20250214_000006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ============================================================================
+    # COMPRESSION: lz4 for the JSONB payload (propagates to all partitions)
+    # ============================================================================
+    op.execute("""
+        DO $$ BEGIN
+            ALTER TABLE reel_log_entries ALTER COLUMN data SET COMPRESSION lz4;
+        EXCEPTION
+            WHEN feature_not_supported OR syntax_error THEN
+                RAISE NOTICE 'lz4 compression not available, keeping pglz for reel_log_entries.data';
+        END $$
+    """)
+
+    # Keep user agents out-of-line and compressed when large
+    op.execute("ALTER TABLE reel_log_entries ALTER COLUMN user_agent SET STORAGE EXTENDED")
+
+
+def downgrade() -> None:
+    op.execute("""
+        DO $$ BEGIN
+            ALTER TABLE reel_log_entries ALTER COLUMN data SET COMPRESSION DEFAULT;
+        EXCEPTION
+            WHEN feature_not_supported OR syntax_error THEN null;
+        END $$
+    """)
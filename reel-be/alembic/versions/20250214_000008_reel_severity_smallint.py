@@ -0,0 +1,96 @@
+"""Store reel log severity as SMALLINT ordinals
+
+Revision ID: 20250214_000008
+Revises: 20250214_000007
+Create Date: 2025-02-14
+
+Converts severity in reel_log_entries and reel_log_stats_daily from
+log_severity_enum to SMALLINT (DEBUG=0, INFO=1, WARNING=2, ERROR=3, CRITICAL=4).
+Ordinals shrink idx_reel_tenant_severity, avoid enum ALTERs, and turn
+minimum-severity filters into a single range predicate.
+
+The reel_log_entries_v view exposes the label as log_severity_enum for SQL
+consumers that relied on the enum column.
+
+Dependencies: Reel lz4 compression migration (20250214_000007)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20250214_000008'
+down_revision: Union[str, None] = '20250214_000007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TO_LEVEL = """
+    CASE severity
+        WHEN 'DEBUG' THEN 0
+        WHEN 'INFO' THEN 1
+        WHEN 'WARNING' THEN 2
+        WHEN 'ERROR' THEN 3
+        WHEN 'CRITICAL' THEN 4
+    END
+"""
+
+TO_LABEL = "(ARRAY['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'])[severity + 1]::log_severity_enum"
+
+
+def upgrade() -> None:
+    # ============================================================================
+    # REEL LOG ENTRIES: enum -> SMALLINT (rewrites all partitions)
+    # ============================================================================
+    op.execute(f"""
+        ALTER TABLE reel_log_entries
+            ALTER COLUMN severity DROP DEFAULT,
+            ALTER COLUMN severity TYPE SMALLINT USING {TO_LEVEL},
+            ALTER COLUMN severity SET DEFAULT 1,
+            ADD CONSTRAINT ck_reel_severity_range CHECK (severity BETWEEN 0 AND 4)
+    """)
+
+    # ============================================================================
+    # REEL LOG STATS DAILY: enum -> SMALLINT
+    # ============================================================================
+    op.execute(f"""
+        ALTER TABLE reel_log_stats_daily
+            ALTER COLUMN severity TYPE SMALLINT USING {TO_LEVEL},
+            ADD CONSTRAINT ck_reel_stats_severity_range CHECK (severity BETWEEN 0 AND 4)
+    """)
+
+    # ============================================================================
+    # COMPATIBILITY VIEW: severity as enum label
+    # ============================================================================
+    op.execute(f"""
+        CREATE OR REPLACE VIEW reel_log_entries_v AS
+        SELECT
+            id, actor_id, actor_email, actor_name, tenant_id, client_id,
+            module, action, {TO_LABEL} AS severity,
+            resource_type, resource_id, data, ip_address, user_agent, request_id,
+            created_at
+        FROM reel_log_entries
+    """)
+
+    op.execute("COMMENT ON COLUMN reel_log_entries.severity IS 'Log severity level (0=DEBUG, 1=INFO, 2=WARNING, 3=ERROR, 4=CRITICAL)'")
+    op.execute("COMMENT ON VIEW reel_log_entries_v IS 'reel_log_entries with severity as log_severity_enum label'")
+
+
+def downgrade() -> None:
+    op.execute("DROP VIEW IF EXISTS reel_log_entries_v")
+
+    op.execute(f"""
+        ALTER TABLE reel_log_stats_daily
+            DROP CONSTRAINT IF EXISTS ck_reel_stats_severity_range,
+            ALTER COLUMN severity TYPE log_severity_enum USING {TO_LABEL}
+    """)
+
+    op.execute(f"""
+        ALTER TABLE reel_log_entries
+            DROP CONSTRAINT IF EXISTS ck_reel_severity_range,
+            ALTER COLUMN severity DROP DEFAULT,
+            ALTER COLUMN severity TYPE log_severity_enum USING {TO_LABEL},
+            ALTER COLUMN severity SET DEFAULT 'INFO'
+    """)
+
+    op.execute("COMMENT ON COLUMN reel_log_entries.severity IS 'Log severity level'")
@@ -0,0 +1,48 @@
+"""Add trigram index for reel free-text payload search
+
+Revision ID: 20250214_000009
+Revises: 20250214_000008
+Create Date: 2025-02-14
+
+Adds a tenant-scoped pg_trgm GIN index on the text form of
+reel_log_entries.data so that free-text search (data::text ILIKE '%term%')
+no longer scans every tenant row. Terms shorter than three characters have
+no trigrams and cannot use the index. JSON-object searches keep using the
+containment index idx_reel_data_gin.
+
+Dependencies: Reel severity SMALLINT migration (20250214_000008)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20250214_000009'
+down_revision: Union[str, None] = '20250214_000008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ============================================================================
+    # EXTENSIONS
+    # ============================================================================
+
+    # Already installed by 20250214_000002; repeated so this index stands alone
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+
+    # ============================================================================
+    # INDEXES: Free-text payload search
+    # ============================================================================
+
+    # Created on the partitioned parent (CONCURRENTLY is not supported there)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_reel_tenant_data_trgm
+        ON reel_log_entries USING GIN (tenant_id, (data::text) gin_trgm_ops)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_reel_tenant_data_trgm")
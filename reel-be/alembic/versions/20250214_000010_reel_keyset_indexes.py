@@ -0,0 +1,57 @@
+"""Align reel tenant indexes with the keyset sort order
+
+Revision ID: 20250214_000010
+Revises: 20250214_000009
+Create Date: 2025-02-14
+
+Lists and exports order by (created_at DESC, id DESC). The tenant index now
+carries id as well, so keyset pages and ties on created_at are read in index
+order with no Sort node:
+
+- idx_reel_tenant_created (tenant_id, created_at DESC)
+  -> idx_reel_tenant_created_id (tenant_id, created_at DESC, id DESC)
+- idx_reel_tenant_actor (tenant_id, actor_id)
+  -> idx_reel_tenant_actor_created (tenant_id, actor_id, created_at DESC)
+
+(tenant_id, module) lookups are already served by the leading columns of
+idx_reel_tenant_module_action.
+
+Dependencies: Reel data trigram index migration (20250214_000009)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20250214_000010'
+down_revision: Union[str, None] = '20250214_000009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ============================================================================
+    # INDEXES: Create replacements before dropping the old ones
+    # ============================================================================
+
+    # Created on the partitioned parent (CONCURRENTLY is not supported there)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_reel_tenant_created_id
+        ON reel_log_entries(tenant_id, created_at DESC, id DESC)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_reel_tenant_actor_created
+        ON reel_log_entries(tenant_id, actor_id, created_at DESC)
+    """)
+
+    op.execute("DROP INDEX IF EXISTS idx_reel_tenant_created")
+    op.execute("DROP INDEX IF EXISTS idx_reel_tenant_actor")
+
+
+def downgrade() -> None:
+    op.execute("CREATE INDEX IF NOT EXISTS idx_reel_tenant_created ON reel_log_entries(tenant_id, created_at DESC)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_reel_tenant_actor ON reel_log_entries(tenant_id, actor_id)")
+
+    op.execute("DROP INDEX IF EXISTS idx_reel_tenant_created_id")
+    op.execute("DROP INDEX IF EXISTS idx_reel_tenant_actor_created")
@@ -9,15 +9,33 @@ class ReelConfig(BaseSettings):
     # Pagination limits
     max_page_size: int = 100
     default_page_size: int = 50
+    offset_pagination: bool = True  # Allow deprecated page-number (OFFSET) pagination
 
     # Export limits
     max_export_records: int = 10000
+    export_batch_size: int = 1000  # Rows per server-side cursor fetch
+    export_chunk_size: int = 64 * 1024  # Max buffered characters per streamed chunk
+    export_ttl_seconds: int = 3600  # Lifetime reported for prepared exports
+    export_job_threshold: int = 5000  # Prepared exports above this run in the background
+    export_job_dir: str = ""  # Directory for background export files (empty = system temp)
 
     # Retention settings (0 = infinite retention)
     retention_days: int = 0
+    cleanup_batch_size: int = 5000  # Rows per retention DELETE batch
+
+    # Partitioning (reel_log_entries is range-partitioned by month)
+    partition_months_ahead: int = 3
+    cold_tablespace: str = ""  # Tablespace for old partitions (empty = disabled)
+    cold_after_months: int = 6
+    partition_lock_timeout_ms: int = 2000  # Max wait for the parent lock when dropping a partition
 
     # Performance settings
+    stats_cache_ttl: float = 15.0  # Seconds a tenant's stats are served from cache (0 = disabled)
+    stats_cache_size: int = 1024  # Max tenants cached per process (least recently used are evicted)
     batch_insert_size: int = 100
+    batch_flush_interval: float = 0.2  # Seconds to accumulate a batch before flushing
+    batch_queue_size: int = 10000  # Max queued entries; beyond this log() writes directly
+    batch_flush_retries: int = 3  # Retries (with backoff) before a failed batch is dropped
 
     class Config:
         env_prefix = "REEL_"
@@ -0,0 +1,10 @@
+"""Reel context - Per-request state shared by the middleware and services"""
+
+from contextvars import ContextVar
+from typing import Optional
+from uuid import UUID
+
+# Correlation ID of the request being handled (None outside a request)
+current_request_id: ContextVar[Optional[UUID]] = ContextVar(
+    "reel_request_id", default=None
+)
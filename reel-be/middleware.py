@@ -0,0 +1,68 @@
+"""Reel middleware - Per-request metadata for audit logging"""
+
+from typing import Any, Optional
+from uuid import UUID, uuid4
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.responses import Response
+
+from .context import current_request_id
+
+# Header carrying the caller's correlation ID
+REQUEST_ID_HEADER = "x-request-id"
+
+
+def _parse_request_id(value: Optional[str]) -> UUID:
+    """Use the caller's request ID if it is a valid UUID, else generate one"""
+    if value:
+        try:
+            return UUID(value)
+        except ValueError:
+            pass
+    return uuid4()
+
+
+def build_request_meta(request: Request) -> dict[str, Any]:
+    """Extract the audit metadata (ip, user agent, request ID) from a request"""
+    return {
+        "ip": request.client.host if request.client else None,
+        "ua": request.headers.get("user-agent"),
+        "request_id": _parse_request_id(request.headers.get(REQUEST_ID_HEADER)),
+    }
+
+
+def get_request_meta(request: Request) -> dict[str, Any]:
+    """
+    Get the audit metadata for a request.
+
+    Reads request.state.reel_meta when ReelRequestMetaMiddleware is installed,
+    otherwise extracts it on demand.
+    """
+    meta = getattr(request.state, "reel_meta", None)
+    if meta is None:
+        meta = build_request_meta(request)
+        request.state.reel_meta = meta
+    return meta
+
+
+class ReelRequestMetaMiddleware(BaseHTTPMiddleware):
+    """
+    Annotates each request with audit metadata.
+
+    Stores {"ip", "ua", "request_id"} on request.state.reel_meta and exposes
+    the request ID through current_request_id, so ReelService.log() can
+    correlate entries without the request being passed down.
+    """
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        meta = build_request_meta(request)
+        request.state.reel_meta = meta
+
+        token = current_request_id.set(meta["request_id"])
+        try:
+            return await call_next(request)
+        finally:
+            current_request_id.reset(token)
@@ -1,5 +1,6 @@
 """Reel models - Log entry storage"""
 
-from .log_entry import LogEntry, LogSeverity
+from .log_entry import LogEntry, LogSeverity, SEVERITY_LEVELS
+from .log_stats import LogStatsDaily
 
-__all__ = ["LogEntry", "LogSeverity"]
+__all__ = ["LogEntry", "LogSeverity", "SEVERITY_LEVELS", "LogStatsDaily"]
@@ -1,11 +1,12 @@
 """LogEntry model - Audit log entries for all modules"""
 
 import enum
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, Enum, Index, String, Text
+from sqlalchemy import CheckConstraint, DateTime, Index, SmallInteger, String, Text, text
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
@@ -24,6 +25,34 @@ class LogSeverity(str, enum.Enum):
     CRITICAL = "CRITICAL"
 
 
+# Stored ordinal for each severity (lowest to highest)
+SEVERITY_LEVELS: dict[LogSeverity, int] = {
+    severity: level for level, severity in enumerate(LogSeverity)
+}
+_SEVERITIES_BY_LEVEL: tuple[LogSeverity, ...] = tuple(LogSeverity)
+
+
+class SeverityLevel(TypeDecorator):
+    """Stores LogSeverity as its SMALLINT ordinal (DEBUG=0 ... CRITICAL=4)
+
+    Ordinals keep indexes small and let min-severity filters run as a
+    single range predicate (severity >= :level).
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return SEVERITY_LEVELS[LogSeverity(value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return _SEVERITIES_BY_LEVEL[value]
+
+
 class LogEntry(Base):
     """LogEntry model - stores audit trail for all module actions"""
 
@@ -38,7 +67,6 @@ class LogEntry(Base):
     actor_id: Mapped[Optional[UUID]] = mapped_column(
         PGUUID(as_uuid=True),
         nullable=True,
-        index=True,
         comment="User who performed the action (nullable for system actions)",
     )
     actor_email: Mapped[Optional[str]] = mapped_column(
@@ -56,13 +84,11 @@ class LogEntry(Base):
     tenant_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         nullable=False,
-        index=True,
         comment="Tenant (account) context for the action",
     )
     client_id: Mapped[Optional[UUID]] = mapped_column(
         PGUUID(as_uuid=True),
         nullable=True,
-        index=True,
         comment="Client (local scope) context if applicable",
     )
 
@@ -70,21 +96,18 @@ class LogEntry(Base):
     module: Mapped[str] = mapped_column(
         String(100),
         nullable=False,
-        index=True,
         comment="Source module (guardian, mentor, aurora, etc.)",
     )
     action: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
-        index=True,
         comment="Action identifier (users.login, permissions.grant, etc.)",
     )
     severity: Mapped[LogSeverity] = mapped_column(
-        Enum(LogSeverity),
+        SeverityLevel(),
         nullable=False,
         default=LogSeverity.INFO,
-        index=True,
-        comment="Log severity level",
+        comment="Log severity level (0=DEBUG ... 4=CRITICAL)",
     )
 
     # Resource (optional, for resource-specific actions)
@@ -104,6 +127,8 @@ class LogEntry(Base):
         JSONB,
         nullable=True,
         comment="Action-specific data payload",
+        # Set by migration (SQLAlchemy DDL has no column compression support)
+        info={"compression": "lz4"},
     )
 
     # Request metadata
@@ -120,26 +145,31 @@ class LogEntry(Base):
     request_id: Mapped[Optional[UUID]] = mapped_column(
         PGUUID(as_uuid=True),
         nullable=True,
-        index=True,
         comment="Request correlation ID for tracing",
     )
 
     # Timestamps (no updated_at - logs are immutable)
+    # Part of the primary key: the table is range-partitioned by month on it
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(timezone.utc),
         server_default=func.now(),
         nullable=False,
-        index=True,
     )
 
     # Table indexes for common query patterns
+    # Columns carry no index=True: the tenant-first composites below already
+    # serve tenant-scoped lookups, and extra indexes slow the insert path.
     __table_args__ = (
-        # Tenant log queries (most common)
+        CheckConstraint("severity BETWEEN 0 AND 4", name="ck_reel_severity_range"),
+        # Tenant log queries (most common); matches the (created_at, id) keyset order
         Index(
-            "idx_reel_tenant_created",
+            "idx_reel_tenant_created_id",
             "tenant_id",
             "created_at",
-            postgresql_ops={"created_at": "DESC"},
+            "id",
+            postgresql_ops={"created_at": "DESC", "id": "DESC"},
         ),
         # Client log queries
         Index(
@@ -156,11 +186,21 @@ class LogEntry(Base):
             "module",
             "action",
         ),
-        # User activity lookup
+        # Wildcard action filtering (requires pg_trgm and btree_gin)
+        Index(
+            "idx_reel_tenant_action_trgm",
+            "tenant_id",
+            "action",
+            postgresql_using="gin",
+            postgresql_ops={"action": "gin_trgm_ops"},
+        ),
+        # User activity lookup (newest first)
         Index(
-            "idx_reel_tenant_actor",
+            "idx_reel_tenant_actor_created",
             "tenant_id",
             "actor_id",
+            "created_at",
+            postgresql_ops={"created_at": "DESC"},
         ),
         # Severity filtering
         Index(
@@ -170,6 +210,38 @@ class LogEntry(Base):
             "created_at",
             postgresql_ops={"created_at": "DESC"},
         ),
+        # Cross-tenant time-range scans (retention, admin analytics)
+        Index(
+            "idx_reel_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        # Request correlation
+        Index(
+            "idx_reel_request_id",
+            "request_id",
+            postgresql_where=text("request_id IS NOT NULL"),
+        ),
+        # Module index for cross-tenant analytics (admin only)
+        Index("idx_reel_module", "module"),
+        # Payload containment search (data @> '{...}')
+        Index(
+            "idx_reel_data_gin",
+            "data",
+            postgresql_using="gin",
+            postgresql_ops={"data": "jsonb_path_ops"},
+        ),
+        # Free-text payload search (data::text ILIKE '%term%'; requires pg_trgm and btree_gin)
+        Index(
+            "idx_reel_tenant_data_trgm",
+            "tenant_id",
+            text("(data::text) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+        # Monthly partitions (reel_log_entries_YYYY_MM) are managed by migrations
+        # and ReelService.ensure_partitions()
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,55 @@
+"""LogStatsDaily model - Per-tenant daily rollup of log entry counts"""
+
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy import BigInteger, Date, String
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+# Use Matrix infrastructure (Layer 0)
+from src.database import Base
+
+from .log_entry import LogSeverity, SeverityLevel
+
+
+class LogStatsDaily(Base):
+    """LogStatsDaily model - entry counts by (tenant, day, module, severity)
+
+    Maintained alongside every insert so statistics never scan reel_log_entries.
+    """
+
+    __tablename__ = "reel_log_stats_daily"
+
+    tenant_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        primary_key=True,
+        comment="Tenant (account) context",
+    )
+    day: Mapped[date] = mapped_column(
+        Date,
+        primary_key=True,
+        comment="UTC day the entries were created",
+    )
+    module: Mapped[str] = mapped_column(
+        String(100),
+        primary_key=True,
+        comment="Source module",
+    )
+    severity: Mapped[LogSeverity] = mapped_column(
+        SeverityLevel(),
+        primary_key=True,
+        comment="Log severity level",
+    )
+    count: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        comment="Number of entries in this bucket",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<LogStatsDaily(tenant_id={self.tenant_id}, day={self.day}, "
+            f"module={self.module}, severity={self.severity}, count={self.count})>"
+        )
@@ -1,10 +1,13 @@
 """Log management API endpoints"""
 
-from datetime import datetime, timedelta, timezone
+import json
+from datetime import datetime
 from typing import Annotated, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # Use Matrix infrastructure (Layer 0)
@@ -17,6 +20,7 @@ from src.modules.mentor.dependencies.permissions import require_permission
 from src.modules.mentor.models.policy_assignment import ScopeType
 
 from ..config import reel_config
+from ..middleware import get_request_meta
 from ..models.log_entry import LogSeverity
 from ..schemas.log import (
     LogEntryCreate,
@@ -24,10 +28,29 @@ from ..schemas.log import (
     LogEntryList,
     LogFilter,
     LogStats,
+    ExportFormat,
     LogExportRequest,
     LogExportResponse,
+    ExportStatus,
 )
 from ..services.reel_service import ReelService
+from ..services.export_jobs import get_export_jobs
+from ..services.log_writer import get_log_writer
+
+# orjson (Rust) serializes list/detail responses far faster than stdlib json;
+# fall back to the default encoder when it is not installed. orjson handles
+# UUID/datetime/enum natively, so raw row mappings need no pre-encoding.
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as FastJSONResponse
+    _encode_row = dict
+except ImportError:
+    FastJSONResponse = JSONResponse
+    _encode_row = jsonable_encoder
+
+# Handlers return FastJSONResponse directly so response_model (kept for the
+# OpenAPI schema) does not validate the payload a second time. List pages are
+# validated once in ReelService.list() and dumped here in a single pass.
 
 router = APIRouter()
 
@@ -35,6 +58,7 @@ router = APIRouter()
 @router.get(
     "",
     response_model=LogEntryList,
+    response_class=FastJSONResponse,
     summary="List log entries",
     description="List log entries with filtering and pagination. Requires reel.logs.view permission.",
 )
@@ -44,44 +68,81 @@ async def list_logs(
     db: Annotated[AsyncSession, Depends(get_db)],
     _: None = Depends(require_permission("reel.logs.view")),
     # Pagination
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, deprecated=True, description="Page number (deprecated: use cursor)"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, max_length=200, description="Opaque cursor (next_cursor from the previous page)"),
+    exact_total: bool = Query(False, description="Count matching entries exactly (page-number requests only; slower on large tenants)"),
     # Filters
     module: Optional[str] = Query(None, description="Filter by module"),
-    action: Optional[str] = Query(None, description="Filter by action (supports wildcard: 'users.*')"),
+    action: Optional[str] = Query(None, description="Filter by action (supports '*' wildcards: 'users.*', '*.login')"),
     severity: Optional[LogSeverity] = Query(None, description="Filter by severity"),
+    min_severity: Optional[LogSeverity] = Query(None, description="Filter by minimum severity"),
     actor_id: Optional[UUID] = Query(None, description="Filter by actor"),
     client_id: Optional[UUID] = Query(None, description="Filter by client"),
     start_date: Optional[datetime] = Query(None, description="Filter logs after this date"),
     end_date: Optional[datetime] = Query(None, description="Filter logs before this date"),
-    search: Optional[str] = Query(None, max_length=255, description="Search in data payload"),
-) -> LogEntryList:
+    data_contains: Optional[str] = Query(
+        None,
+        max_length=1000,
+        description="JSON object the data payload must contain, e.g. '{\"key\": \"value\"}'",
+    ),
+    search: Optional[str] = Query(
+        None,
+        max_length=255,
+        description="Free-text search in data payload (prefer data_contains for key/value matches)",
+    ),
+) -> Response:
     """List log entries with filtering and pagination"""
     reel_service = ReelService(db)
 
+    contains = None
+    if data_contains is not None:
+        try:
+            contains = json.loads(data_contains)
+        except ValueError:
+            pass
+        if not isinstance(contains, dict):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="data_contains must be a JSON object",
+            )
+
     # Build filter
     log_filter = LogFilter(
         module=module,
         action=action,
         severity=severity,
+        min_severity=min_severity,
         actor_id=actor_id,
         client_id=client_id,
         start_date=start_date,
         end_date=end_date,
+        data_contains=contains,
         search=search,
     )
 
-    return await reel_service.list(
-        tenant_id=tenant.tenant_id,
-        filter=log_filter,
-        page=page,
-        page_size=page_size,
-    )
+    try:
+        result = await reel_service.list(
+            tenant_id=tenant.tenant_id,
+            filter=log_filter,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            exact_total=exact_total,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    return FastJSONResponse(result.model_dump(mode="json"))
 
 
 @router.get(
     "/stats",
     response_model=LogStats,
+    response_class=FastJSONResponse,
     summary="Get log statistics",
     description="Get log statistics for the current tenant. Requires reel.logs.view permission.",
 )
@@ -99,6 +160,7 @@ async def get_stats(
 @router.get(
     "/{log_id}",
     response_model=LogEntryRead,
+    response_class=FastJSONResponse,
     summary="Get a single log entry",
     description="Get a single log entry by ID. Requires reel.logs.view permission.",
 )
@@ -108,25 +170,33 @@ async def get_log(
     tenant: TenantContext,
     db: Annotated[AsyncSession, Depends(get_db)],
     _: None = Depends(require_permission("reel.logs.view")),
-) -> LogEntryRead:
+) -> Response:
     """Get a single log entry by ID"""
     reel_service = ReelService(db)
 
-    entry = await reel_service.get(log_id, tenant.tenant_id)
+    # Column values come straight from Postgres; no model validation needed
+    entry = await reel_service.get_row(log_id, tenant.tenant_id)
     if not entry:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Log entry not found",
         )
 
-    return LogEntryRead.model_validate(entry)
+    return FastJSONResponse(_encode_row(entry))
+
+
+# Media types for streamed exports
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.JSON: "application/json",
+}
 
 
 @router.post(
     "/export",
-    response_model=LogExportResponse,
+    response_class=StreamingResponse,
     summary="Export logs",
-    description="Export logs to CSV or JSON format. Requires reel.logs.export permission.",
+    description="Stream logs as a CSV or JSON download. Requires reel.logs.export permission.",
 )
 async def export_logs(
     request: LogExportRequest,
@@ -134,32 +204,114 @@ async def export_logs(
     tenant: TenantContext,
     db: Annotated[AsyncSession, Depends(get_db)],
     _: None = Depends(require_permission("reel.logs.export", scope_type=ScopeType.LOCAL)),
-) -> LogExportResponse:
-    """Export logs to file format"""
+) -> StreamingResponse:
+    """Stream logs to file format"""
     reel_service = ReelService(db)
 
-    content, filename, count = await reel_service.export(
-        tenant_id=tenant.tenant_id,
-        request=request,
+    filename = reel_service.export_filename(request)
+
+    return StreamingResponse(
+        reel_service.export(tenant_id=tenant.tenant_id, request=request),
+        media_type=EXPORT_MEDIA_TYPES[request.format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
 
-    # NOTE: Export file storage is intentionally not implemented here.
-    # The actual file storage (S3, local, etc.) should be configured per-deployment.
-    # This returns metadata; the frontend can use content from a streaming endpoint.
-    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
 
-    return LogExportResponse(
-        download_url=f"/api/v1/reel/exports/{filename}",
-        filename=filename,
-        record_count=count,
-        expires_at=expires_at,
+@router.post(
+    "/export/prepare",
+    response_model=LogExportResponse,
+    summary="Prepare log export",
+    description="Get export metadata (record count, filename) before downloading. Requires reel.logs.export permission.",
+)
+async def prepare_export(
+    request: LogExportRequest,
+    current_user: CurrentUser,
+    tenant: TenantContext,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    _: None = Depends(require_permission("reel.logs.export", scope_type=ScopeType.LOCAL)),
+) -> LogExportResponse:
+    """
+    Get export metadata without generating content.
+
+    Exports over export_job_threshold records are started as background
+    jobs (when enabled) and returned as pending.
+    """
+    reel_service = ReelService(db)
+    export_info = await reel_service.prepare_export(tenant.tenant_id, request)
+
+    export_jobs = get_export_jobs()
+    if export_jobs is not None and export_info.record_count > reel_config.export_job_threshold:
+        job = export_jobs.start(
+            tenant.tenant_id,
+            request,
+            export_info.filename,
+            export_info.record_count,
+            export_info.expires_at,
+        )
+        return job.to_response()
+
+    return export_info
+
+
+def _get_export_job(job_id: UUID, tenant_id: UUID):
+    """Look up a background export job for the tenant, or 404"""
+    export_jobs = get_export_jobs()
+    job = export_jobs.get(job_id, tenant_id) if export_jobs is not None else None
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Export not found",
+        )
+    return job
+
+
+@router.get(
+    "/export/{job_id}",
+    response_model=LogExportResponse,
+    summary="Get export status",
+    description="Poll a background export started by /export/prepare. Requires reel.logs.export permission.",
+)
+async def get_export(
+    job_id: UUID,
+    current_user: CurrentUser,
+    tenant: TenantContext,
+    _: None = Depends(require_permission("reel.logs.export", scope_type=ScopeType.LOCAL)),
+) -> LogExportResponse:
+    """Get background export metadata"""
+    return _get_export_job(job_id, tenant.tenant_id).to_response()
+
+
+@router.get(
+    "/export/{job_id}/download",
+    response_class=FileResponse,
+    summary="Download export",
+    description="Download a completed background export. Requires reel.logs.export permission.",
+)
+async def download_export(
+    job_id: UUID,
+    current_user: CurrentUser,
+    tenant: TenantContext,
+    _: None = Depends(require_permission("reel.logs.export", scope_type=ScopeType.LOCAL)),
+) -> FileResponse:
+    """Download a background export file"""
+    job = _get_export_job(job_id, tenant.tenant_id)
+    if job.status != ExportStatus.READY or job.path is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Export is {job.status.value}",
+        )
+
+    return FileResponse(
+        job.path,
+        media_type=EXPORT_MEDIA_TYPES[job.request.format],
+        filename=job.filename,
     )
 
 
 @router.post(
     "",
     response_model=LogEntryRead,
-    status_code=status.HTTP_201_CREATED,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Create log entry (internal)",
     description="Create a log entry. This endpoint is for internal module use only.",
     include_in_schema=False,  # Hide from OpenAPI docs
@@ -167,7 +319,9 @@ async def export_logs(
 async def create_log(
     entry_data: LogEntryCreate,
     request: Request,
+    response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
+    sync: bool = Query(False, description="Write immediately (read-after-write)"),
     # No permission check - internal only
     # In production, validate internal API key or service token
 ) -> LogEntryRead:
@@ -176,14 +330,23 @@ async def create_log(
 
     This endpoint is called by other modules to log actions.
     It should be protected by internal service authentication.
-    """
-    reel_service = ReelService(db)
 
+    Entries are queued for a batched insert and answered with 202; pass
+    sync=true (or run without the log writer) to respond with 201 once the
+    entry is written.
+    """
     # Add request metadata if not provided
+    meta = get_request_meta(request)
     if not entry_data.ip_address:
-        entry_data.ip_address = request.client.host if request.client else None
+        entry_data.ip_address = meta["ip"]
     if not entry_data.user_agent:
-        entry_data.user_agent = request.headers.get("user-agent")
+        entry_data.user_agent = meta["ua"]
+    if not entry_data.request_id:
+        entry_data.request_id = meta["request_id"]
+
+    reel_service = ReelService(db)
+    entry = await reel_service.log_from_schema(entry_data, wait=sync)
 
-    entry = await reel_service.log_from_schema(entry_data)
+    if sync or get_log_writer() is None:
+        response.status_code = status.HTTP_201_CREATED
     return LogEntryRead.model_validate(entry)
@@ -6,8 +6,10 @@ from .log import (
     LogEntryList,
     LogFilter,
     LogStats,
+    ExportFormat,
     LogExportRequest,
     LogExportResponse,
+    ExportStatus,
 )
 
 __all__ = [
@@ -16,6 +18,8 @@ __all__ = [
     "LogEntryList",
     "LogFilter",
     "LogStats",
+    "ExportFormat",
     "LogExportRequest",
     "LogExportResponse",
+    "ExportStatus",
 ]
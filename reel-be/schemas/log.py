@@ -1,5 +1,6 @@
 """Log schemas - Pydantic models for log API endpoints"""
 
+import enum
 from datetime import datetime
 from typing import Any, Optional
 from uuid import UUID
@@ -74,22 +75,34 @@ class LogEntryRead(LogEntryBase):
 
 
 class LogEntryList(BaseModel):
-    """Paginated list of log entries"""
+    """Paginated list of log entries
+
+    Cursor pages (next_cursor) omit total, page and pages to avoid counting.
+    Page-number requests report an exact total only when exact_total is set;
+    otherwise unfiltered lists report the tenant total from the daily stats
+    rollup (total_estimated=True) and filtered lists omit it.
+    """
 
     items: list[LogEntryRead]
-    total: int
-    page: int
+    total: Optional[int] = None
+    total_estimated: bool = False
+    page: Optional[int] = None
     page_size: int
-    pages: int
+    pages: Optional[int] = None
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
                 "items": [],
                 "total": 100,
+                "total_estimated": False,
                 "page": 1,
                 "page_size": 50,
                 "pages": 2,
+                "has_more": True,
+                "next_cursor": "eyJjcmVhdGVkX2F0IjoiMjAyNC0wMS0xNVQxMjowMDowMCswMDowMCIsImlkIjoiMTIzZTQ1NjctZTg5Yi0xMmQzLWE0NTYtNDI2NjE0MTc0MDAwIn0=",
             }
         }
     )
@@ -120,7 +133,10 @@ class LogFilter(BaseModel):
     # Client filter (within tenant)
     client_id: Optional[UUID] = None
 
-    # Search in data payload
+    # Data payload filters (prefer data_contains; search scans the payload text)
+    data_contains: Optional[dict[str, Any]] = Field(
+        None, description="JSON object the data payload must contain"
+    )
     search: Optional[str] = Field(None, max_length=255)
 
     model_config = ConfigDict(
@@ -164,11 +180,18 @@ class LogStats(BaseModel):
     )
 
 
+class ExportFormat(str, enum.Enum):
+    """Log export file formats"""
+
+    CSV = "csv"
+    JSON = "json"
+
+
 class LogExportRequest(BaseModel):
     """Request for log export"""
 
     filter: Optional[LogFilter] = None
-    format: str = Field(default="csv", pattern="^(csv|json)$")
+    format: ExportFormat = ExportFormat.CSV
     include_data: bool = Field(default=False, description="Include data payload in export")
 
     model_config = ConfigDict(
@@ -182,21 +205,39 @@ class LogExportRequest(BaseModel):
     )
 
 
+class ExportStatus(str, enum.Enum):
+    """Log export states"""
+
+    PENDING = "pending"  # Background export still being generated
+    READY = "ready"
+    FAILED = "failed"
+
+
 class LogExportResponse(BaseModel):
-    """Response for log export request"""
+    """Metadata for a log export (content is streamed or generated separately)
+
+    Small exports are READY immediately with no job_id: POST download_url
+    with the same request body to stream them. Large exports run as a
+    background job: poll GET /export/{job_id} until READY, then GET
+    download_url.
+    """
 
     download_url: str
     filename: str
     record_count: int
     expires_at: datetime
+    status: ExportStatus = ExportStatus.READY
+    job_id: Optional[UUID] = None
 
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
-                "download_url": "/api/v1/reel/exports/abc123.csv",
+                "download_url": "/api/v1/reel/logs/export",
                 "filename": "logs_2024-01-15_export.csv",
                 "record_count": 500,
                 "expires_at": "2024-01-15T12:00:00Z",
+                "status": "ready",
+                "job_id": None,
             }
         }
     )
@@ -1,5 +1,18 @@
 """Reel services - Business logic for logging"""
 
 from .reel_service import ReelService, get_reel_service
+from .log_writer import LogWriter, get_log_writer, start_log_writer, stop_log_writer
+from .export_jobs import ExportJobs, get_export_jobs, start_export_jobs, stop_export_jobs
 
-__all__ = ["ReelService", "get_reel_service"]
+__all__ = [
+    "ReelService",
+    "get_reel_service",
+    "LogWriter",
+    "get_log_writer",
+    "start_log_writer",
+    "stop_log_writer",
+    "ExportJobs",
+    "get_export_jobs",
+    "start_export_jobs",
+    "stop_export_jobs",
+]
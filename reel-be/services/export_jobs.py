@@ -0,0 +1,183 @@
+"""ExportJobs - Background generation of large log exports"""
+
+import asyncio
+import logging
+import os
+import tempfile
+from datetime import datetime, timezone
+from typing import Callable, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import reel_config
+from ..schemas.log import ExportStatus, LogExportRequest, LogExportResponse
+from .reel_service import EXPORT_DOWNLOAD_URL, ReelService
+
+logger = logging.getLogger(__name__)
+
+
+class ExportJob:
+    """State of one background export"""
+
+    def __init__(
+        self,
+        tenant_id: UUID,
+        request: LogExportRequest,
+        filename: str,
+        record_count: int,
+        expires_at: datetime,
+    ):
+        self.id = uuid4()
+        self.tenant_id = tenant_id
+        self.request = request
+        self.filename = filename
+        self.record_count = record_count
+        self.expires_at = expires_at
+        self.status = ExportStatus.PENDING
+        self.path: Optional[str] = None
+        self.task: Optional[asyncio.Task] = None
+
+    def to_response(self) -> LogExportResponse:
+        """Export metadata for polling clients"""
+        return LogExportResponse(
+            download_url=f"{EXPORT_DOWNLOAD_URL}/{self.id}/download",
+            filename=self.filename,
+            record_count=self.record_count,
+            expires_at=self.expires_at,
+            status=self.status,
+            job_id=self.id,
+        )
+
+
+class ExportJobs:
+    """
+    Runs large exports in background tasks and keeps the files until expiry.
+
+    Each job opens its own session, streams ReelService.export() into a file
+    under export_job_dir, and is dropped (file included) once expires_at
+    passes. Jobs live in process memory, so poll the instance that started
+    the job (or use sticky routing).
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        directory: Optional[str] = None,
+    ):
+        self.session_factory = session_factory
+        self.directory = directory or reel_config.export_job_dir or None
+        self._jobs: dict[UUID, ExportJob] = {}
+
+    def start(
+        self,
+        tenant_id: UUID,
+        request: LogExportRequest,
+        filename: str,
+        record_count: int,
+        expires_at: datetime,
+    ) -> ExportJob:
+        """Start a background export"""
+        self._expire()
+
+        job = ExportJob(tenant_id, request, filename, record_count, expires_at)
+        job.task = asyncio.create_task(self._run(job), name=f"reel-export-{job.id}")
+        self._jobs[job.id] = job
+        return job
+
+    def get(self, job_id: UUID, tenant_id: UUID) -> Optional[ExportJob]:
+        """Get a job by ID (scoped to tenant)"""
+        self._expire()
+
+        job = self._jobs.get(job_id)
+        if job is None or job.tenant_id != tenant_id:
+            return None
+        return job
+
+    async def stop(self) -> None:
+        """Cancel running jobs and remove all export files"""
+        for job in self._jobs.values():
+            if job.task is not None and not job.task.done():
+                job.task.cancel()
+        await asyncio.gather(
+            *(job.task for job in self._jobs.values() if job.task is not None),
+            return_exceptions=True,
+        )
+        for job in self._jobs.values():
+            self._remove_file(job)
+        self._jobs.clear()
+
+    async def _run(self, job: ExportJob) -> None:
+        """Stream the export into a file"""
+        try:
+            fd, job.path = tempfile.mkstemp(
+                prefix="reel-export-",
+                suffix=f".{job.request.format.value}",
+                dir=self.directory,
+            )
+            with os.fdopen(fd, "wb") as file:
+                async with self.session_factory() as session:
+                    chunks = ReelService(session).export(job.tenant_id, job.request)
+                    async for chunk in chunks:
+                        if isinstance(chunk, str):
+                            chunk = chunk.encode()
+                        await asyncio.to_thread(file.write, chunk)
+        except Exception:
+            logger.exception(f"REEL export job {job.id} failed")
+            job.status = ExportStatus.FAILED
+            self._remove_file(job)
+            return
+
+        job.status = ExportStatus.READY
+
+    def _expire(self) -> None:
+        """Drop jobs (and files) past their expiry"""
+        now = datetime.now(timezone.utc)
+        for job_id, job in list(self._jobs.items()):
+            if job.expires_at > now:
+                continue
+            if job.task is not None and not job.task.done():
+                job.task.cancel()
+            self._remove_file(job)
+            del self._jobs[job_id]
+
+    @staticmethod
+    def _remove_file(job: ExportJob) -> None:
+        if job.path is None:
+            return
+        try:
+            os.remove(job.path)
+        except FileNotFoundError:
+            pass
+        job.path = None
+
+
+# Global job manager (started from the application lifespan)
+_export_jobs: Optional[ExportJobs] = None
+
+
+def get_export_jobs() -> Optional[ExportJobs]:
+    """Get the export job manager, or None if background exports are not enabled"""
+    return _export_jobs
+
+
+def start_export_jobs(session_factory: Callable[[], AsyncSession]) -> ExportJobs:
+    """
+    Enable background exports.
+
+    Call from the application lifespan startup with the session factory
+    (e.g. an async_sessionmaker). Until started, every export is streamed
+    in the request.
+    """
+    global _export_jobs
+    if _export_jobs is None:
+        _export_jobs = ExportJobs(session_factory)
+    return _export_jobs
+
+
+async def stop_export_jobs() -> None:
+    """Stop background exports, cancelling running jobs and removing files"""
+    global _export_jobs
+    if _export_jobs is not None:
+        await _export_jobs.stop()
+        _export_jobs = None
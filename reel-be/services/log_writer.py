@@ -0,0 +1,209 @@
+"""LogWriter - Write-behind queue for batched log inserts"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+from uuid import uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import reel_config
+from ..models.log_entry import LogEntry, LogSeverity
+from .stats import invalidate_stats_cache, record_daily_stats
+
+logger = logging.getLogger(__name__)
+
+# Severities that skip accumulation and are flushed immediately
+URGENT_SEVERITIES = frozenset({LogSeverity.ERROR, LogSeverity.CRITICAL})
+
+# Delay before the first flush retry; doubled for each further attempt
+FLUSH_RETRY_DELAY = 0.1
+
+
+def build_row(values: dict[str, Any]) -> dict[str, Any]:
+    """
+    Build an insertable row from log entry column values.
+
+    The id and created_at are generated here (not by the database) so the
+    caller can be answered before the row is flushed.
+    """
+    row = dict(values)
+    row["id"] = uuid4()
+    row["created_at"] = datetime.now(timezone.utc)
+    return row
+
+
+class LogWriter:
+    """
+    Background writer that coalesces log entries into multi-row inserts.
+
+    Entries are drained from an in-process queue and flushed when either
+    batch_insert_size rows have accumulated or the flush interval elapses.
+    ERROR and CRITICAL entries trigger an immediate flush. Callers that need
+    the row to be durable can await the future returned by enqueue(wait=True).
+
+    A failed batch is retried batch_flush_retries times with exponential
+    backoff (transient connection errors, deadlocks) before it is dropped.
+    The queue holds at most batch_queue_size entries, so a slow or
+    unavailable database pushes callers back to direct writes instead of
+    growing memory.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        queue_size: Optional[int] = None,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size or reel_config.batch_insert_size
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else reel_config.batch_flush_interval
+        )
+        self._queue: asyncio.Queue[
+            Optional[tuple[dict[str, Any], Optional[asyncio.Future]]]
+        ] = asyncio.Queue(queue_size or reel_config.batch_queue_size)
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background flush task"""
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name="reel-log-writer")
+
+    async def stop(self) -> None:
+        """Stop the background task, flushing any queued entries"""
+        if not self.running:
+            return
+        await self._queue.put(None)  # Sentinel: flush and exit
+        await self._task
+        self._task = None
+
+    def enqueue(
+        self, row: dict[str, Any], wait: bool = False
+    ) -> Optional[asyncio.Future]:
+        """
+        Queue a row for the next batched insert.
+
+        With wait=True, returns a future that resolves once the row's batch
+        is committed (or raises the flush error).
+
+        Raises:
+            asyncio.QueueFull: If batch_queue_size entries are already queued
+        """
+        flushed = asyncio.get_running_loop().create_future() if wait else None
+        self._queue.put_nowait((row, flushed))
+        return flushed
+
+    async def _run(self) -> None:
+        """Drain the queue in batches until the stop sentinel is received"""
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                break
+
+            row, flushed = item
+            batch = [row]
+            waiters = [flushed] if flushed is not None else []
+            urgent = row["severity"] in URGENT_SEVERITIES
+            deadline = loop.time() + self.flush_interval
+
+            while len(batch) < self.batch_size and not urgent:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                row, flushed = item
+                batch.append(row)
+                if flushed is not None:
+                    waiters.append(flushed)
+                urgent = row["severity"] in URGENT_SEVERITIES
+
+            await self._flush(batch, waiters)
+
+    async def _flush(
+        self, rows: list[dict[str, Any]], waiters: list[asyncio.Future]
+    ) -> None:
+        """Insert a batch of rows in a single executemany statement, retrying on failure"""
+        retries = reel_config.batch_flush_retries
+        for attempt in range(retries + 1):
+            try:
+                async with self.session_factory() as session:
+                    await session.execute(insert(LogEntry), rows)
+                    await record_daily_stats(session, rows)
+                    await session.commit()
+                break
+            except Exception as e:
+                if attempt < retries:
+                    logger.warning(
+                        f"Failed to flush {len(rows)} REEL log entries "
+                        f"(attempt {attempt + 1}), retrying: {e}"
+                    )
+                    await asyncio.sleep(FLUSH_RETRY_DELAY * 2**attempt)
+                    continue
+
+                # Never let a failed batch kill the writer
+                logger.exception(
+                    f"Dropped {len(rows)} REEL log entries after {attempt + 1} attempts"
+                )
+                for flushed in waiters:
+                    if not flushed.done():
+                        flushed.set_exception(e)
+                return
+
+        invalidate_stats_cache({row["tenant_id"] for row in rows})
+
+        for flushed in waiters:
+            if not flushed.done():
+                flushed.set_result(None)
+
+
+# Global writer instance (started from the application lifespan)
+_log_writer: Optional[LogWriter] = None
+
+
+def get_log_writer() -> Optional[LogWriter]:
+    """Get the running log writer, or None if batching is not enabled"""
+    if _log_writer is not None and _log_writer.running:
+        return _log_writer
+    return None
+
+
+def start_log_writer(session_factory: Callable[[], AsyncSession]) -> LogWriter:
+    """
+    Start the global log writer.
+
+    Call from the application lifespan startup with the session factory
+    (e.g. an async_sessionmaker). Until started, log entries are written
+    synchronously.
+    """
+    global _log_writer
+    if _log_writer is None:
+        _log_writer = LogWriter(session_factory)
+    _log_writer.start()
+    return _log_writer
+
+
+async def stop_log_writer() -> None:
+    """Stop the global log writer, flushing pending entries"""
+    global _log_writer
+    if _log_writer is not None:
+        await _log_writer.stop()
+        _log_writer = None
@@ -1,26 +1,213 @@
 """ReelService - Core logging service for audit trail"""
 
+import asyncio
+import base64
+import contextlib
 import csv
 import io
 import json
+import logging
+import re
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
-from uuid import UUID, uuid4
+from typing import Any, AsyncIterator, Optional, Sequence, Union
+from uuid import UUID
 
-from sqlalchemy import func, select, and_, or_, case
+from pydantic import TypeAdapter
+from sqlalchemy import Date, DateTime, SmallInteger, Text, bindparam, delete, func, insert, literal_column, or_, select, text, and_, case, cast, tuple_, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from ..config import reel_config
-from ..models.log_entry import LogEntry, LogSeverity
+from ..context import current_request_id
+from ..models.log_entry import SEVERITY_LEVELS, LogEntry, LogSeverity
+from ..models.log_stats import LogStatsDaily
 from ..schemas.log import (
     LogEntryCreate,
     LogEntryRead,
     LogEntryList,
     LogFilter,
     LogStats,
+    ExportFormat,
     LogExportRequest,
     LogExportResponse,
 )
+from .log_writer import build_row, get_log_writer
+from .stats import cache_stats, get_cached_stats, invalidate_stats_cache, record_daily_stats
+
+logger = logging.getLogger(__name__)
+
+
+def _json_default(value: Any) -> Any:
+    """Encode the values stdlib json cannot (UUID, datetime)"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# orjson (Rust) encodes UUID/datetime/enum natively and much faster than
+# stdlib json; fall back to json with the same output types when missing
+try:
+    from orjson import dumps as _json_bytes
+except ImportError:
+    def _json_bytes(value: Any) -> bytes:
+        return json.dumps(value, default=_json_default).encode()
+
+
+# Monthly partitions of reel_log_entries are named reel_log_entries_YYYY_MM
+PARTITION_NAME_RE = re.compile(r"reel_log_entries_(\d{4})_(\d{2})")
+DEFAULT_PARTITION = "reel_log_entries_default"
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    """Shift a first-of-month datetime by a number of months"""
+    month_index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=month_index // 12, month=month_index % 12 + 1)
+
+
+# Export metadata: streamed download endpoint and link lifetime
+EXPORT_DOWNLOAD_URL = "/api/v1/reel/logs/export"
+EXPORT_TTL = timedelta(seconds=reel_config.export_ttl_seconds)
+
+# (epoch second, formatted timestamp) of the last export clock read
+_export_clock_cache: tuple[int, str] = (0, "")
+
+
+def _export_clock() -> tuple[int, str]:
+    """
+    Current UTC epoch second and its filename timestamp.
+
+    Export filenames only need second granularity, so the formatted value
+    is reused for every call within the same second.
+    """
+    global _export_clock_cache
+    now_seconds = time.time_ns() // 1_000_000_000
+    if now_seconds != _export_clock_cache[0]:
+        _export_clock_cache = (
+            now_seconds,
+            time.strftime("%Y%m%d_%H%M%S", time.gmtime(now_seconds)),
+        )
+    return _export_clock_cache
+
+
+# Prepared-statement friendly building blocks: values are bound with .params(),
+# so each filter shape compiles (and is prepared by asyncpg) once
+_TENANT_LOGS = select(LogEntry).where(LogEntry.tenant_id == bindparam("tenant_id"))
+_AFTER_CURSOR = tuple_(LogEntry.created_at, LogEntry.id) < tuple_(
+    bindparam("cursor_created_at", type_=DateTime(timezone=True)),
+    bindparam("cursor_id", type_=PGUUID(as_uuid=True)),
+)
+_NEWEST_FIRST = (LogEntry.created_at.desc(), LogEntry.id.desc())
+
+# min_severity predicates, built once. Severity is stored as an ordinal, so
+# "at least" is a single range predicate (served by idx_reel_tenant_severity);
+# the lowest level matches every entry and has no predicate
+_SEVERITY_AT_LEAST = {
+    severity: LogEntry.severity >= severity
+    for severity, level in SEVERITY_LEVELS.items()
+    if level > 0
+}
+
+# Page validator: one compiled pydantic-core schema for the whole entry list,
+# applied once; the router dumps the resulting LogEntryList without revalidating
+_ENTRY_LIST_ADAPTER = TypeAdapter(list[LogEntryRead])
+
+# Detail read: only the LogEntryRead columns, returned as a plain row mapping
+_LOG_DETAIL = select(
+    *(LogEntry.__table__.c[name] for name in LogEntryRead.model_fields)
+).where(
+    LogEntry.id == bindparam("log_id"),
+    LogEntry.tenant_id == bindparam("tenant_id"),
+)
+
+# Tenant stats in one round-trip: totals via FILTER, breakdowns as JSONB objects
+_stats_buckets = (
+    select(LogStatsDaily)
+    .where(LogStatsDaily.tenant_id == bindparam("tenant_id"))
+    .cte("tenant_buckets")
+)
+_severity_counts = (
+    select(
+        _stats_buckets.c.severity.label("key"),
+        func.sum(_stats_buckets.c.count).label("n"),
+    )
+    .group_by(_stats_buckets.c.severity)
+    .subquery("severity_counts")
+)
+_module_counts = (
+    select(
+        _stats_buckets.c.module.label("key"),
+        func.sum(_stats_buckets.c.count).label("n"),
+    )
+    .group_by(_stats_buckets.c.module)
+    .subquery("module_counts")
+)
+_TENANT_STATS = select(
+    func.coalesce(func.sum(_stats_buckets.c.count), 0).label("total"),
+    func.coalesce(
+        func.sum(_stats_buckets.c.count).filter(
+            _stats_buckets.c.day >= bindparam("today", type_=Date)
+        ),
+        0,
+    ).label("today"),
+    func.coalesce(
+        func.sum(_stats_buckets.c.count).filter(
+            _stats_buckets.c.day >= bindparam("week_start", type_=Date)
+        ),
+        0,
+    ).label("this_week"),
+    select(
+        func.jsonb_object_agg(_severity_counts.c.key, _severity_counts.c.n, type_=JSONB)
+    ).scalar_subquery().label("by_severity"),
+    select(
+        func.jsonb_object_agg(_module_counts.c.key, _module_counts.c.n, type_=JSONB)
+    ).scalar_subquery().label("by_module"),
+).select_from(_stats_buckets)
+
+# Export columns rendered by Postgres (COPY CSV / json_build_object), formatted
+# like the Python writers: severity labels and UTC timestamps as isoformat()
+# prints them (fractional seconds only when non-zero). The data payload is
+# jsonb's own text, so its whitespace and key order can differ from orjson's
+_created_at_utc = func.timezone("UTC", LogEntry.created_at)
+_EXPORT_COLUMNS = {
+    "id": LogEntry.id,
+    "created_at": case(
+        (
+            func.date_trunc("second", _created_at_utc) == _created_at_utc,
+            func.to_char(_created_at_utc, 'YYYY-MM-DD"T"HH24:MI:SS"+00:00"'),
+        ),
+        else_=func.to_char(_created_at_utc, 'YYYY-MM-DD"T"HH24:MI:SS.US"+00:00"'),
+    ),
+    "module": LogEntry.module,
+    "action": LogEntry.action,
+    "severity": case(
+        {level: severity.value for severity, level in SEVERITY_LEVELS.items()},
+        value=type_coerce(LogEntry.severity, SmallInteger),
+    ),
+    "actor_id": LogEntry.actor_id,
+    "actor_email": LogEntry.actor_email,
+    "actor_name": LogEntry.actor_name,
+    "tenant_id": LogEntry.tenant_id,
+    "client_id": LogEntry.client_id,
+    "resource_type": LogEntry.resource_type,
+    "resource_id": LogEntry.resource_id,
+    "ip_address": LogEntry.ip_address,
+}
+
+# Chunks buffered between the COPY reader and the response stream
+_COPY_QUEUE_SIZE = 16
+
+# Tenant entry total from the rollup (approximate page-number totals)
+_TENANT_ROLLUP_TOTAL = select(
+    func.coalesce(func.sum(LogStatsDaily.count), 0)
+).where(LogStatsDaily.tenant_id == bindparam("tenant_id"))
+
+# Severity label for each stored ordinal, as it appears in JSONB object keys
+_SEVERITY_LABELS = {str(level): severity.value for severity, level in SEVERITY_LEVELS.items()}
 
 
 class ReelService:
@@ -46,38 +233,71 @@ class ReelService:
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
         request_id: Optional[UUID] = None,
+        wait: bool = False,
     ) -> LogEntry:
         """
         Create a new log entry.
 
         This is the primary method other modules use to log actions.
+        The request_id defaults to the current request's correlation ID
+        (see ReelRequestMetaMiddleware).
+
+        While the log writer runs (start_log_writer), the entry is queued for
+        the next batched insert and returned as a transient LogEntry with a
+        client-generated id and created_at; pass wait=True to return only
+        once its batch is committed. Without the writer (or while its queue
+        is full), the entry is inserted (Core insert, no ORM flush) and
+        committed in this session.
         """
-        entry = LogEntry(
-            module=module,
-            action=action,
-            tenant_id=tenant_id,
-            actor_id=actor_id,
-            actor_email=actor_email,
-            actor_name=actor_name,
-            client_id=client_id,
-            resource_type=resource_type,
-            resource_id=resource_id,
-            data=data,
-            severity=severity,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            request_id=request_id,
-        )
+        if request_id is None:
+            request_id = current_request_id.get()
+
+        values = {
+            "module": module,
+            "action": action,
+            "tenant_id": tenant_id,
+            "actor_id": actor_id,
+            "actor_email": actor_email,
+            "actor_name": actor_name,
+            "client_id": client_id,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "data": data,
+            "severity": severity,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+            "request_id": request_id,
+        }
+
+        # id and created_at are generated client-side, so the returned entry
+        # is complete without reading the row back
+        row = build_row(values)
 
-        self.db.add(entry)
+        log_writer = get_log_writer()
+        if log_writer is not None:
+            try:
+                flushed = log_writer.enqueue(row, wait=wait)
+            except asyncio.QueueFull:
+                pass  # Writer is backlogged: write this entry directly
+            else:
+                if flushed is not None:
+                    await flushed
+                return LogEntry(**row)
+
+        # Core insert: no unit-of-work bookkeeping for an append-only row
+        await self.db.execute(insert(LogEntry).values(row))
+        await record_daily_stats(self.db, [row])
         await self.db.commit()
-        await self.db.refresh(entry)
+        invalidate_stats_cache([tenant_id])
 
-        return entry
+        return LogEntry(**row)
 
-    async def log_from_schema(self, entry_data: LogEntryCreate) -> LogEntry:
+    async def log_from_schema(
+        self, entry_data: LogEntryCreate, wait: bool = False
+    ) -> LogEntry:
         """Create a log entry from a Pydantic schema"""
         return await self.log(
+            wait=wait,
             module=entry_data.module,
             action=entry_data.action,
             tenant_id=entry_data.tenant_id,
@@ -103,57 +323,133 @@ class ReelService:
         )
         return result.scalar_one_or_none()
 
+    async def get_row(self, log_id: UUID, tenant_id: UUID) -> Optional[dict[str, Any]]:
+        """
+        Get a single log entry as a column mapping (scoped to tenant).
+
+        Skips ORM entity construction for read-only responses; keys match
+        LogEntryRead fields.
+        """
+        result = await self.db.execute(
+            _LOG_DETAIL.params(log_id=log_id, tenant_id=tenant_id)
+        )
+        row = result.mappings().one_or_none()
+        return dict(row) if row is not None else None
+
     async def list(
         self,
         tenant_id: UUID,
         filter: Optional[LogFilter] = None,
         page: int = 1,
         page_size: int = 50,
+        cursor: Optional[str] = None,
+        exact_total: bool = False,
     ) -> LogEntryList:
         """
         List log entries with filtering and pagination.
 
+        With a cursor (next_cursor from a previous page), seeks past the last
+        seen (created_at, id) instead of using OFFSET and skips the total
+        count. Page-number pagination is kept for backward compatibility
+        unless disabled with REEL_OFFSET_PAGINATION=false, in which case
+        requests without a cursor read the first page the same way.
+
+        Page-number requests only run COUNT(*) when exact_total is set.
+        Otherwise an unfiltered list takes its total from the daily stats
+        rollup, and a filtered list returns no total (has_more still applies).
+
         All queries are scoped to the tenant for security.
+
+        Raises:
+            ValueError: If the cursor is malformed, or a page number is
+                requested while offset pagination is disabled
         """
         # Validate pagination
         page_size = min(page_size, reel_config.max_page_size)
         page = max(page, 1)
+        offset_pagination = not cursor and reel_config.offset_pagination
+
+        if page > 1 and not cursor and not offset_pagination:
+            raise ValueError("Page-number pagination is disabled; use cursor")
 
         # Base query
-        query = select(LogEntry).where(LogEntry.tenant_id == tenant_id)
+        query = _TENANT_LOGS.params(tenant_id=tenant_id)
 
         # Apply filters
         if filter:
             query = self._apply_filters(query, filter)
 
-        # Order by created_at DESC (newest first)
-        query = query.order_by(LogEntry.created_at.desc())
+        total: Optional[int] = None
+        total_estimated = False
+        pages: Optional[int] = None
 
-        # Get total count
-        count_query = select(func.count()).select_from(
-            query.subquery()
-        )
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
+        if cursor:
+            # Keyset pagination: seek past the cursor position
+            cursor_created_at, cursor_id = self._decode_cursor(cursor)
+            query = query.where(_AFTER_CURSOR).params(
+                cursor_created_at=cursor_created_at, cursor_id=cursor_id
+            )
+        elif offset_pagination:
+            # Get total count (page-number pagination only)
+            if exact_total:
+                count_query = select(func.count()).select_from(
+                    query.subquery()
+                )
+                total_result = await self.db.execute(count_query)
+                total = total_result.scalar() or 0
+            elif filter is None or not filter.model_dump(exclude_none=True):
+                # Unfiltered: sum the tenant's rollup buckets instead of
+                # counting entries
+                total_result = await self.db.execute(
+                    _TENANT_ROLLUP_TOTAL.params(tenant_id=tenant_id)
+                )
+                total = int(total_result.scalar() or 0)
+                total_estimated = True
+
+            if total is not None:
+                pages = (total + page_size - 1) // page_size if total > 0 else 0
 
-        # Apply pagination
-        offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
+            # Deprecated: page-number pagination via OFFSET
+            query = query.offset((page - 1) * page_size)
 
-        # Execute query
-        result = await self.db.execute(query)
+        # Order by created_at DESC (newest first), id breaks ties
+        query = query.order_by(*_NEWEST_FIRST)
+
+        # Fetch one extra row to detect a following page
+        result = await self.db.execute(query.limit(page_size + 1))
         entries = result.scalars().all()
 
-        # Calculate pages
-        pages = (total + page_size - 1) // page_size if total > 0 else 0
+        has_more = len(entries) > page_size
+        entries = entries[:page_size]
 
         return LogEntryList(
-            items=[LogEntryRead.model_validate(e) for e in entries],
+            items=_ENTRY_LIST_ADAPTER.validate_python(entries, from_attributes=True),
             total=total,
-            page=page,
+            total_estimated=total_estimated,
+            page=page if offset_pagination else None,
             page_size=page_size,
             pages=pages,
+            has_more=has_more,
+            next_cursor=self._encode_cursor(entries[-1]) if has_more else None,
+        )
+
+    @staticmethod
+    def _encode_cursor(entry: LogEntry) -> str:
+        """Encode an entry's sort position as an opaque cursor"""
+        raw = json.dumps(
+            {"created_at": entry.created_at.isoformat(), "id": str(entry.id)},
+            separators=(",", ":"),
         )
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+        """Decode a cursor into its (created_at, id) sort position"""
+        try:
+            position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return datetime.fromisoformat(position["created_at"]), UUID(position["id"])
+        except (ValueError, TypeError, KeyError) as e:
+            raise ValueError("Invalid pagination cursor") from e
 
     def _apply_filters(self, query, filter: LogFilter):
         """Apply filter conditions to query"""
@@ -173,32 +469,19 @@ class ReelService:
         if filter.module:
             conditions.append(LogEntry.module == filter.module)
         if filter.action:
-            # Support partial matching for action hierarchy
-            if filter.action.endswith(".*"):
-                prefix = filter.action[:-1]  # Remove *
-                conditions.append(LogEntry.action.like(f"{prefix}%"))
+            # Support wildcard matching for action hierarchy ('users.*', '*.login')
+            if "*" in filter.action:
+                # Served by the idx_reel_tenant_action_trgm trigram index
+                pattern = self._wildcard_to_like(filter.action)
+                conditions.append(LogEntry.action.ilike(pattern, escape="\\"))
             else:
                 conditions.append(LogEntry.action == filter.action)
 
         # Severity
         if filter.severity:
             conditions.append(LogEntry.severity == filter.severity)
-        if filter.min_severity:
-            severity_order = {
-                LogSeverity.DEBUG: 0,
-                LogSeverity.INFO: 1,
-                LogSeverity.WARNING: 2,
-                LogSeverity.ERROR: 3,
-                LogSeverity.CRITICAL: 4,
-            }
-            min_level = severity_order.get(filter.min_severity, 0)
-            severity_conditions = [
-                LogEntry.severity == sev
-                for sev, level in severity_order.items()
-                if level >= min_level
-            ]
-            if severity_conditions:
-                conditions.append(or_(*severity_conditions))
+        if filter.min_severity in _SEVERITY_AT_LEAST:
+            conditions.append(_SEVERITY_AT_LEAST[filter.min_severity])
 
         # Resource
         if filter.resource_type:
@@ -210,190 +493,464 @@ class ReelService:
         if filter.client_id:
             conditions.append(LogEntry.client_id == filter.client_id)
 
-        # Search in data payload (PostgreSQL JSONB contains)
-        if filter.search:
-            # Search in data as text
+        # Data payload: structured match, served by the idx_reel_data_gin index
+        if filter.data_contains:
             conditions.append(
-                LogEntry.data.astext.ilike(f"%{filter.search}%")
+                LogEntry.data.op("@>")(cast(filter.data_contains, JSONB))
             )
 
+        if filter.search:
+            search_dict = self._parse_search(filter.search)
+            if search_dict is not None:
+                # Containment is served by the idx_reel_data_gin index
+                conditions.append(
+                    LogEntry.data.op("@>")(cast(search_dict, JSONB))
+                )
+            else:
+                # Free text searches data as text. Terms of 3+ characters are
+                # served by idx_reel_tenant_data_trgm; shorter terms have no
+                # trigrams and are checked row by row within the other filters
+                term = self._escape_like(filter.search)
+                conditions.append(
+                    cast(LogEntry.data, Text).ilike(f"%{term}%", escape="\\")
+                )
+
         if conditions:
             query = query.where(and_(*conditions))
 
         return query
 
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        """Escape LIKE metacharacters so value matches literally"""
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    @classmethod
+    def _wildcard_to_like(cls, pattern: str) -> str:
+        """Translate a '*' wildcard pattern to a LIKE pattern"""
+        return cls._escape_like(pattern).replace("*", "%")
+
+    @staticmethod
+    def _parse_search(search: str) -> Optional[dict[str, Any]]:
+        """Parse a search term as a JSON object for containment matching"""
+        if not search.lstrip().startswith("{"):
+            return None
+        try:
+            parsed = json.loads(search)
+        except ValueError:
+            return None
+        return parsed if isinstance(parsed, dict) else None
+
     async def get_stats(self, tenant_id: UUID) -> LogStats:
-        """Get log statistics for a tenant"""
-        now = datetime.now(timezone.utc)
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        week_start = today_start - timedelta(days=now.weekday())
+        """
+        Get log statistics for a tenant.
 
-        # Total entries
-        total_result = await self.db.execute(
-            select(func.count()).where(LogEntry.tenant_id == tenant_id)
-        )
-        total_entries = total_result.scalar() or 0
+        Reads the reel_log_stats_daily rollup, so cost scales with the number
+        of (day, module, severity) buckets rather than the number of entries.
+        Totals and breakdowns come from a single statement (one round-trip).
+
+        Results are cached per tenant for stats_cache_ttl seconds; committing
+        new entries for the tenant drops its cached stats.
+        """
+        cached = get_cached_stats(tenant_id)
+        if cached is not None:
+            return cached
+
+        today = datetime.now(timezone.utc).date()
+        week_start = today - timedelta(days=today.weekday())
 
-        # Entries by severity
-        severity_result = await self.db.execute(
-            select(LogEntry.severity, func.count())
-            .where(LogEntry.tenant_id == tenant_id)
-            .group_by(LogEntry.severity)
+        result = await self.db.execute(
+            _TENANT_STATS.params(tenant_id=tenant_id, today=today, week_start=week_start)
         )
+        row = result.one()
+
+        # jsonb_object_agg yields NULL (not {}) for a tenant with no entries
         entries_by_severity = {
-            str(row[0].value): row[1] for row in severity_result.all()
+            _SEVERITY_LABELS[level]: count
+            for level, count in (row.by_severity or {}).items()
         }
 
-        # Entries by module
-        module_result = await self.db.execute(
-            select(LogEntry.module, func.count())
-            .where(LogEntry.tenant_id == tenant_id)
-            .group_by(LogEntry.module)
+        stats = LogStats(
+            total_entries=row.total,
+            entries_by_severity=entries_by_severity,
+            entries_by_module=row.by_module or {},
+            entries_today=row.today,
+            entries_this_week=row.this_week,
         )
-        entries_by_module = {row[0]: row[1] for row in module_result.all()}
-
-        # Entries today
-        today_result = await self.db.execute(
-            select(func.count()).where(
-                and_(
-                    LogEntry.tenant_id == tenant_id,
-                    LogEntry.created_at >= today_start,
-                )
-            )
+
+        cache_stats(tenant_id, stats)
+        return stats
+
+    def _export_query(self, tenant_id: UUID, request: LogExportRequest):
+        """Build the export query (scoped to tenant, capped at export limit)"""
+        query = _TENANT_LOGS.params(tenant_id=tenant_id)
+
+        if request.filter:
+            query = self._apply_filters(query, request.filter)
+
+        return query.order_by(*_NEWEST_FIRST).limit(
+            reel_config.max_export_records
         )
-        entries_today = today_result.scalar() or 0
-
-        # Entries this week
-        week_result = await self.db.execute(
-            select(func.count()).where(
-                and_(
-                    LogEntry.tenant_id == tenant_id,
-                    LogEntry.created_at >= week_start,
-                )
-            )
+
+    def export_filename(self, request: LogExportRequest) -> str:
+        """Generate the download filename for an export"""
+        _, timestamp = _export_clock()
+        return f"logs_{timestamp}.{request.format.value}"
+
+    async def prepare_export(
+        self, tenant_id: UUID, request: LogExportRequest
+    ) -> LogExportResponse:
+        """
+        Build export metadata without generating content.
+
+        The export is reported as ready with the POST /export download_url,
+        which streams it given the same request body. The router hands
+        exports over export_job_threshold records to the background export
+        jobs instead (see services.export_jobs).
+        """
+        count = await self.count_export(tenant_id, request)
+        filename = self.export_filename(request)
+        now_seconds, _ = _export_clock()
+
+        return LogExportResponse(
+            download_url=EXPORT_DOWNLOAD_URL,
+            filename=filename,
+            record_count=count,
+            expires_at=datetime.fromtimestamp(now_seconds, timezone.utc) + EXPORT_TTL,
         )
-        entries_this_week = week_result.scalar() or 0
 
-        return LogStats(
-            total_entries=total_entries,
-            entries_by_severity=entries_by_severity,
-            entries_by_module=entries_by_module,
-            entries_today=entries_today,
-            entries_this_week=entries_this_week,
+    async def count_export(self, tenant_id: UUID, request: LogExportRequest) -> int:
+        """Count the records an export would contain"""
+        count_query = select(func.count()).select_from(
+            self._export_query(tenant_id, request).subquery()
         )
+        result = await self.db.execute(count_query)
+        return result.scalar() or 0
 
     async def export(
         self,
         tenant_id: UUID,
         request: LogExportRequest,
-    ) -> tuple[str, str, int]:
+    ) -> AsyncIterator[Union[str, bytes]]:
         """
         Export logs to CSV or JSON format.
 
-        Returns: (content, filename, record_count)
+        On asyncpg, Postgres renders the export itself (COPY ... TO STDOUT
+        for CSV, json_build_object for JSON), so rows are never built as
+        Python objects. Other drivers fall back to the Python writers.
+        Either way chunks are yielded as rows arrive, so memory stays
+        bounded by the chunk size rather than the export size.
         """
-        # Get all matching logs (up to export limit)
-        query = select(LogEntry).where(LogEntry.tenant_id == tenant_id)
+        query = self._export_query(tenant_id, request)
 
-        if request.filter:
-            query = self._apply_filters(query, request.filter)
+        # Resolve the writer once, not per row
+        if self.db.get_bind().dialect.driver == "asyncpg":
+            write_chunks = _SERVER_FORMAT_WRITERS[request.format]
+            # aclosing: if the client disconnects, the writer's cleanup runs
+            # now rather than whenever the abandoned generator is collected
+            async with contextlib.aclosing(
+                write_chunks(self, query, request.include_data)
+            ) as chunks:
+                async for chunk in chunks:
+                    yield chunk
+            return
 
-        query = query.order_by(LogEntry.created_at.desc()).limit(
-            reel_config.max_export_records
+        write_chunks = _FORMAT_WRITERS[request.format]
+
+        # Don't fetch (and detoast) payloads that will not be written
+        if not request.include_data:
+            query = query.options(defer(LogEntry.data))
+
+        result = await self.db.stream(
+            query.execution_options(yield_per=reel_config.export_batch_size)
         )
+        batches = result.scalars().partitions()
 
-        result = await self.db.execute(query)
-        entries = result.scalars().all()
+        async for chunk in write_chunks(self, batches, request.include_data):
+            yield chunk
 
-        # Generate filename
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        filename = f"logs_{timestamp}.{request.format}"
+    @staticmethod
+    def _export_columns(include_data: bool) -> dict[str, Any]:
+        """Server-rendered export columns by output field name"""
+        if not include_data:
+            return _EXPORT_COLUMNS
+        return {**_EXPORT_COLUMNS, "data": LogEntry.data}
 
-        # Generate content
-        if request.format == "json":
-            content = self._export_json(entries, request.include_data)
-        else:
-            content = self._export_csv(entries, request.include_data)
+    async def _copy_csv(self, query, include_data: bool) -> AsyncIterator[bytes]:
+        """Export entries to CSV with COPY ... TO STDOUT (asyncpg only)"""
+        columns = self._export_columns(include_data)
+        query = query.with_only_columns(
+            *(column.label(name) for name, column in columns.items())
+        )
 
-        return content, filename, len(entries)
+        connection = await self.db.connection()
+        dialect = connection.dialect
+        compiled = query.compile(dialect=dialect)
 
-    def _export_csv(self, entries: list[LogEntry], include_data: bool) -> str:
-        """Export entries to CSV format"""
+        # asyncpg takes positional arguments; apply the column types' bind
+        # processing (e.g. severity label -> ordinal) as execute() would
+        params = compiled.construct_params()
+        args = []
+        for name in compiled.positiontup:
+            processor = compiled.binds[name].type.dialect_impl(dialect).bind_processor(dialect)
+            args.append(processor(params[name]) if processor else params[name])
+
+        raw_connection = await connection.get_raw_connection()
+        chunks: asyncio.Queue[Optional[bytes]] = asyncio.Queue(_COPY_QUEUE_SIZE)
+
+        async def copy() -> None:
+            try:
+                await raw_connection.driver_connection.copy_from_query(
+                    compiled.string,
+                    *args,
+                    output=chunks.put,
+                    format="csv",
+                    header=True,
+                )
+            except asyncio.CancelledError:
+                raise  # Cancelled by the reader, which no longer waits for the end
+            except Exception:
+                await chunks.put(None)  # Wake the reader; await copy_task re-raises
+                raise
+            await chunks.put(None)
+
+        copy_task = asyncio.create_task(copy())
+        try:
+            while (chunk := await chunks.get()) is not None:
+                yield chunk
+            await copy_task  # Surface COPY errors
+        finally:
+            # Client went away mid-export: stop COPY before the connection is
+            # rolled back or returned to the pool
+            if not copy_task.done():
+                copy_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await copy_task
+
+    async def _stream_json(self, query, include_data: bool) -> AsyncIterator[str]:
+        """Export entries to JSON with rows rendered by json_build_object"""
+        columns = self._export_columns(include_data)
+        query = query.with_only_columns(
+            cast(
+                func.json_build_object(
+                    *(part for name, column in columns.items() for part in (name, column))
+                ),
+                Text,
+            )
+        ).execution_options(yield_per=reel_config.export_batch_size)
+
+        chunk_size = reel_config.export_chunk_size
+        count = 0
+        yield '{"logs": ['
+
+        result = await self.db.stream(query)
+        async for batch in result.scalars().partitions():
+            parts = []
+            pending = 0
+            for item in batch:
+                encoded = ("," if count else "") + item
+                count += 1
+                parts.append(encoded)
+                pending += len(encoded)
+                if pending >= chunk_size:
+                    yield "".join(parts)
+                    parts = []
+                    pending = 0
+
+            # Flush before waiting on the next fetch
+            if parts:
+                yield "".join(parts)
+
+        yield f'], "count": {count}}}'
+
+    async def _export_csv(
+        self, batches: AsyncIterator[Sequence[LogEntry]], include_data: bool
+    ) -> AsyncIterator[str]:
+        """Export entries to CSV format, flushing every export_chunk_size characters"""
+        dumps = _json_bytes
+        chunk_size = reel_config.export_chunk_size
         output = io.StringIO()
 
-        fieldnames = [
-            "id",
-            "created_at",
-            "module",
-            "action",
-            "severity",
-            "actor_id",
-            "actor_email",
-            "actor_name",
-            "tenant_id",
-            "client_id",
-            "resource_type",
-            "resource_id",
-            "ip_address",
-        ]
-        if include_data:
-            fieldnames.append("data")
-
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for entry in entries:
-            row = {
-                "id": str(entry.id),
-                "created_at": entry.created_at.isoformat(),
-                "module": entry.module,
-                "action": entry.action,
-                "severity": entry.severity.value,
-                "actor_id": str(entry.actor_id) if entry.actor_id else "",
-                "actor_email": entry.actor_email or "",
-                "actor_name": entry.actor_name or "",
-                "tenant_id": str(entry.tenant_id),
-                "client_id": str(entry.client_id) if entry.client_id else "",
-                "resource_type": entry.resource_type or "",
-                "resource_id": str(entry.resource_id) if entry.resource_id else "",
-                "ip_address": entry.ip_address or "",
-            }
-            if include_data:
-                row["data"] = json.dumps(entry.data) if entry.data else ""
-            writer.writerow(row)
-
-        return output.getvalue()
-
-    def _export_json(self, entries: list[LogEntry], include_data: bool) -> str:
-        """Export entries to JSON format"""
-        items = []
-        for entry in entries:
-            item = {
-                "id": str(entry.id),
-                "created_at": entry.created_at.isoformat(),
-                "module": entry.module,
-                "action": entry.action,
-                "severity": entry.severity.value,
-                "actor_id": str(entry.actor_id) if entry.actor_id else None,
-                "actor_email": entry.actor_email,
-                "actor_name": entry.actor_name,
-                "tenant_id": str(entry.tenant_id),
-                "client_id": str(entry.client_id) if entry.client_id else None,
-                "resource_type": entry.resource_type,
-                "resource_id": str(entry.resource_id) if entry.resource_id else None,
-                "ip_address": entry.ip_address,
-            }
-            if include_data:
-                item["data"] = entry.data
-            items.append(item)
-
-        return json.dumps({"logs": items, "count": len(items)}, indent=2)
+        # Same columns, in the same order, as the COPY export
+        writer = csv.writer(output)
+        writer.writerow(self._export_columns(include_data))
+        writerow = writer.writerow
+
+        async for batch in batches:
+            for entry in batch:
+                # csv.writer writes None as "" and str()s UUIDs itself
+                row = (
+                    entry.id,
+                    entry.created_at.isoformat(),
+                    entry.module,
+                    entry.action,
+                    entry.severity.value,
+                    entry.actor_id,
+                    entry.actor_email,
+                    entry.actor_name,
+                    entry.tenant_id,
+                    entry.client_id,
+                    entry.resource_type,
+                    entry.resource_id,
+                    entry.ip_address,
+                )
+                if include_data:
+                    # NULL is an empty field; {} is written as {} like COPY does
+                    row += (dumps(entry.data).decode() if entry.data is not None else "",)
+                writerow(row)
+                if output.tell() >= chunk_size:
+                    yield output.getvalue()
+                    output.seek(0)
+                    output.truncate(0)
+
+            # Flush before waiting on the next fetch
+            if output.tell():
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate(0)
+
+        # Header-only export when no rows matched
+        if output.tell():
+            yield output.getvalue()
+
+    async def _export_json(
+        self, batches: AsyncIterator[Sequence[LogEntry]], include_data: bool
+    ) -> AsyncIterator[bytes]:
+        """Export entries to JSON format, flushing every export_chunk_size bytes"""
+        dumps = _json_bytes
+        chunk_size = reel_config.export_chunk_size
+        count = 0
+        yield b'{"logs": ['
+
+        async for batch in batches:
+            parts = []
+            pending = 0
+            for entry in batch:
+                # UUIDs, datetimes and the severity enum are encoded by dumps
+                item = {
+                    "id": entry.id,
+                    "created_at": entry.created_at,
+                    "module": entry.module,
+                    "action": entry.action,
+                    "severity": entry.severity,
+                    "actor_id": entry.actor_id,
+                    "actor_email": entry.actor_email,
+                    "actor_name": entry.actor_name,
+                    "tenant_id": entry.tenant_id,
+                    "client_id": entry.client_id,
+                    "resource_type": entry.resource_type,
+                    "resource_id": entry.resource_id,
+                    "ip_address": entry.ip_address,
+                }
+                if include_data:
+                    item["data"] = entry.data
+                encoded = (b"," if count else b"") + dumps(item)
+                count += 1
+                parts.append(encoded)
+                pending += len(encoded)
+                if pending >= chunk_size:
+                    yield b"".join(parts)
+                    parts = []
+                    pending = 0
+
+            # Flush before waiting on the next fetch
+            if parts:
+                yield b"".join(parts)
+
+        yield b'], "count": %d}' % count
+
+    async def ensure_partitions(self, months_ahead: Optional[int] = None) -> int:
+        """
+        Create missing monthly partitions from the current month forward.
+
+        Run on a schedule (e.g. daily) so inserts never fall through to the
+        default partition. Months that did land there get their partition
+        too, with their rows moved into it. Returns number of partitions
+        created.
+        """
+        if months_ahead is None:
+            months_ahead = reel_config.partition_months_ahead
+
+        result = await self.db.execute(
+            text("SELECT reel_ensure_log_partitions(:months_ahead)"),
+            {"months_ahead": months_ahead},
+        )
+        created = result.scalar() or 0
+        await self.db.commit()
+
+        return created
+
+    async def _list_partitions(self) -> Sequence[tuple[str, datetime, int, str]]:
+        """List monthly partitions as (name, month_start, estimated_rows, tablespace)"""
+        result = await self.db.execute(
+            text("""
+                SELECT c.relname, c.reltuples::bigint, COALESCE(t.spcname, '')
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                LEFT JOIN pg_tablespace t ON t.oid = c.reltablespace
+                WHERE i.inhparent = 'reel_log_entries'::regclass
+            """)
+        )
+
+        partitions = []
+        for name, rows, tablespace in result.all():
+            match = PARTITION_NAME_RE.fullmatch(name)
+            if match:
+                month_start = datetime(
+                    int(match[1]), int(match[2]), 1, tzinfo=timezone.utc
+                )
+                # reltuples is -1 for partitions never analyzed
+                partitions.append((name, month_start, max(rows, 0), tablespace))
+
+        return partitions
+
+    async def move_cold_partitions(self) -> int:
+        """
+        Move partitions older than cold_after_months to cold_tablespace.
+
+        Each move rewrites the partition under an exclusive lock; run off-peak.
+        Returns number of partitions moved.
+        """
+        if not reel_config.cold_tablespace:
+            return 0  # Tiering disabled
+
+        now = datetime.now(timezone.utc)
+        threshold = _add_months(
+            now.replace(day=1, hour=0, minute=0, second=0, microsecond=0),
+            -reel_config.cold_after_months,
+        )
+        tablespace = '"' + reel_config.cold_tablespace.replace('"', '""') + '"'
+
+        moved = 0
+        for name, month_start, _, current in await self._list_partitions():
+            if month_start < threshold and current != reel_config.cold_tablespace:
+                await self.db.execute(
+                    text(f'ALTER TABLE "{name}" SET TABLESPACE {tablespace}')
+                )
+                moved += 1
+        await self.db.commit()
+
+        return moved
 
     async def cleanup_old_entries(self) -> int:
         """
         Delete log entries older than retention period.
 
-        Returns number of deleted entries.
+        Monthly partitions that are entirely past the cutoff are dropped
+        outright; only the boundary month needs a row-level DELETE, which runs
+        in batches of cleanup_batch_size rows with a commit after each batch
+        to keep locks and WAL bursts bounded.
+
+        Each drop takes ACCESS EXCLUSIVE on reel_log_entries, so every
+        partition is dropped in its own short transaction, and gives up after
+        partition_lock_timeout_ms instead of queueing all log reads and writes
+        behind a long-running query. A partition that times out is retried on
+        the next run: the row-level DELETE only covers the boundary month and
+        the DEFAULT partition, so it never empties a skipped partition row by
+        row. (DETACH PARTITION CONCURRENTLY is not an option while the
+        DEFAULT partition exists.)
+
+        Returns number of deleted entries (estimated for dropped partitions).
         """
         if reel_config.retention_days <= 0:
             return 0  # Retention disabled
@@ -402,22 +959,76 @@ class ReelService:
             days=reel_config.retention_days
         )
 
-        # Count entries to delete
-        count_result = await self.db.execute(
-            select(func.count()).where(LogEntry.created_at < cutoff)
-        )
-        count = count_result.scalar() or 0
+        deleted = 0
+
+        # Drop fully expired partitions (no per-row DELETE, no index bloat)
+        expired = [
+            (name, rows)
+            for name, month_start, rows, _ in await self._list_partitions()
+            if _add_months(month_start, 1) <= cutoff
+        ]
+        await self.db.commit()
 
-        if count > 0:
-            # Delete in batches to avoid long locks
-            from sqlalchemy import delete
+        lock_timeout = f"SET LOCAL lock_timeout = {int(reel_config.partition_lock_timeout_ms)}"
+        for name, rows in expired:
+            try:
+                await self.db.execute(text(lock_timeout))
+                await self.db.execute(text(f'DROP TABLE "{name}"'))
+                await self.db.commit()
+            except DBAPIError as e:
+                await self.db.rollback()
+                logger.warning(f"Skipped dropping expired REEL partition {name}: {e}")
+                continue
+            deleted += rows
 
-            await self.db.execute(
-                delete(LogEntry).where(LogEntry.created_at < cutoff)
+        # Delete the remaining expired rows (boundary month, default partition).
+        # Batches are keyed by primary key: ctid is not unique across partitions
+        boundary_month = cutoff.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        batch_size = reel_config.cleanup_batch_size
+        expired_batch = (
+            select(LogEntry.id, LogEntry.created_at)
+            .where(
+                LogEntry.created_at < cutoff,
+                or_(
+                    LogEntry.created_at >= boundary_month,
+                    literal_column("tableoid") == text(f"'{DEFAULT_PARTITION}'::regclass"),
+                ),
+            )
+            .limit(batch_size)
+        )
+        while True:
+            result = await self.db.execute(
+                delete(LogEntry).where(
+                    tuple_(LogEntry.id, LogEntry.created_at).in_(expired_batch)
+                )
             )
             await self.db.commit()
+            batch_deleted = result.rowcount or 0
+            deleted += batch_deleted
+            if batch_deleted < batch_size:
+                break
+            await asyncio.sleep(0)  # Let other tasks run between batches
+
+        # Drop rollup buckets for days that are now fully expired
+        await self.db.execute(
+            delete(LogStatsDaily).where(LogStatsDaily.day < cutoff.date())
+        )
+        await self.db.commit()
+
+        return deleted
+
+
+# Export chunk writers by format (Python fallback)
+_FORMAT_WRITERS = {
+    ExportFormat.CSV: ReelService._export_csv,
+    ExportFormat.JSON: ReelService._export_json,
+}
 
-        return count
+# Export chunk writers by format, rendered by Postgres (asyncpg)
+_SERVER_FORMAT_WRITERS = {
+    ExportFormat.CSV: ReelService._copy_csv,
+    ExportFormat.JSON: ReelService._stream_json,
+}
 
 
 def get_reel_service(db: AsyncSession) -> ReelService:
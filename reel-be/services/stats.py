@@ -0,0 +1,103 @@
+"""Stats - Daily rollup maintenance and per-tenant stats cache"""
+
+import time
+from collections import Counter, OrderedDict
+from datetime import timezone
+from typing import Any, Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import reel_config
+from ..models.log_entry import SEVERITY_LEVELS, LogSeverity
+from ..models.log_stats import LogStatsDaily
+from ..schemas.log import LogStats
+
+
+async def record_daily_stats(db: AsyncSession, rows: list[dict[str, Any]]) -> None:
+    """
+    Increment the daily stats rollup for a batch of inserted log rows.
+
+    Rows are bucketed on the UTC day of their created_at (set by build_row).
+    Must run in the same transaction as the insert.
+
+    Each bucket is a hot row: concurrent writers touching the same
+    (tenant, day, module, severity) serialize on its row lock until commit.
+    Buckets are upserted sorted by primary key columns (severity by its
+    stored ordinal) so that concurrent batches lock shared rows in the same
+    order and cannot deadlock.
+    """
+    buckets = Counter(
+        (
+            row["tenant_id"],
+            row["created_at"].astimezone(timezone.utc).date(),
+            row["module"],
+            row["severity"],
+        )
+        for row in rows
+    )
+    stmt = pg_insert(LogStatsDaily).values(
+        [
+            {
+                "tenant_id": tenant_id,
+                "day": day,
+                "module": module,
+                "severity": severity,
+                "count": count,
+            }
+            for (tenant_id, day, module, severity), count in sorted(
+                buckets.items(),
+                key=lambda bucket: (*bucket[0][:3], SEVERITY_LEVELS[LogSeverity(bucket[0][3])]),
+            )
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[
+            LogStatsDaily.tenant_id,
+            LogStatsDaily.day,
+            LogStatsDaily.module,
+            LogStatsDaily.severity,
+        ],
+        set_={"count": LogStatsDaily.count + stmt.excluded.count},
+    )
+    await db.execute(stmt)
+
+
+# tenant_id -> (monotonic expiry, stats), least recently used first and capped
+# at stats_cache_size. Per process: other replicas keep serving their copy for
+# up to stats_cache_ttl after a write
+_stats_cache: OrderedDict[UUID, tuple[float, LogStats]] = OrderedDict()
+
+
+def invalidate_stats_cache(tenant_ids: Iterable[UUID]) -> None:
+    """Drop cached stats for tenants whose entries were just committed"""
+    for tenant_id in tenant_ids:
+        _stats_cache.pop(tenant_id, None)
+
+
+def get_cached_stats(tenant_id: UUID) -> Optional[LogStats]:
+    """Cached stats for a tenant, or None if missing, expired or disabled"""
+    if reel_config.stats_cache_ttl <= 0:
+        return None
+    cached = _stats_cache.get(tenant_id)
+    if cached is None:
+        return None
+    if cached[0] <= time.monotonic():
+        del _stats_cache[tenant_id]
+        return None
+    _stats_cache.move_to_end(tenant_id)
+    return cached[1]
+
+
+def cache_stats(tenant_id: UUID, stats: LogStats) -> None:
+    """Cache a tenant's stats for stats_cache_ttl seconds"""
+    if reel_config.stats_cache_ttl <= 0:
+        return
+    _stats_cache[tenant_id] = (
+        time.monotonic() + reel_config.stats_cache_ttl,
+        stats,
+    )
+    _stats_cache.move_to_end(tenant_id)
+    while len(_stats_cache) > reel_config.stats_cache_size:
+        _stats_cache.popitem(last=False)
@@ -14,7 +14,6 @@ import type {
   LogEntryCreate,
   LogSeverity,
   LogFilter,
-  LogExportResponse,
 } from '../types'
 
 /**
@@ -80,6 +79,7 @@ export function useReel(options: UseReelOptions = {}) {
     logs,
     currentLog,
     totalLogs,
+    totalEstimated,
     currentPage,
     totalPages,
     filter,
@@ -287,7 +287,7 @@ export function useReel(options: UseReelOptions = {}) {
   async function exportLogs(
     format: 'csv' | 'json' = 'csv',
     includeData = false
-  ): Promise<LogExportResponse | null> {
+  ): Promise<Blob | null> {
     try {
       return await store.exportCurrentLogs(format, includeData)
     } catch {
@@ -337,6 +337,7 @@ export function useReel(options: UseReelOptions = {}) {
     logs,
     currentLog,
     totalLogs,
+    totalEstimated,
     currentPage,
     totalPages,
     filter,
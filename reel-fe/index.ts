@@ -6,7 +6,7 @@
  * Exports:
  * - useReelStore: Pinia store for log state management
  * - useReel: Composable for logging and log viewing
- * - API functions: fetchLogs, fetchLog, fetchLogStats, exportLogs, createLog
+ * - API functions: fetchLogs, fetchLog, fetchLogStats, exportLogs, prepareLogExport, createLog
  * - Types: LogEntry, LogFilter, LogStats, etc.
  */
 
@@ -23,6 +23,8 @@ export {
   fetchLog,
   fetchLogStats,
   exportLogs,
+  prepareLogExport,
+  fetchLogExportJob,
   createLog,
   downloadLogExport,
 } from './services/reel-api'
@@ -36,6 +38,7 @@ export type {
   LogStats,
   LogExportRequest,
   LogExportResponse,
+  ExportStatus,
   LogEntryCreate,
   LogQueryParams,
   PaginationParams,
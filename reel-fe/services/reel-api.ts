@@ -29,7 +29,7 @@ function buildQueryParams(params: LogQueryParams): URLSearchParams {
 
   Object.entries(params).forEach(([key, value]) => {
     if (value !== undefined && value !== null && value !== '') {
-      searchParams.append(key, String(value))
+      searchParams.append(key, typeof value === 'object' ? JSON.stringify(value) : String(value))
     }
   })
 
@@ -65,10 +65,30 @@ export async function fetchLogStats(): Promise<LogStats> {
 }
 
 /**
- * Export logs to file format
+ * Export logs to file format (streamed CSV/JSON download)
  */
-export async function exportLogs(request: LogExportRequest = {}): Promise<LogExportResponse> {
-  const response = await client.post<LogExportResponse>('/v1/reel/logs/export', request)
+export async function exportLogs(request: LogExportRequest = {}): Promise<Blob> {
+  const response = await client.post('/v1/reel/logs/export', request, {
+    responseType: 'blob',
+  })
+  return response.data
+}
+
+/**
+ * Get export metadata (record count, filename) before downloading
+ */
+export async function prepareLogExport(
+  request: LogExportRequest = {}
+): Promise<LogExportResponse> {
+  const response = await client.post<LogExportResponse>('/v1/reel/logs/export/prepare', request)
+  return response.data
+}
+
+/**
+ * Poll a background export started by prepareLogExport (status 'pending')
+ */
+export async function fetchLogExportJob(jobId: string): Promise<LogExportResponse> {
+  const response = await client.get<LogExportResponse>(`/v1/reel/logs/export/${jobId}`)
   return response.data
 }
 
@@ -84,10 +104,20 @@ export async function createLog(entry: LogEntryCreate): Promise<LogEntry> {
 }
 
 /**
- * Download exported log file
+ * Download the file for a prepared export
+ *
+ * Background exports (job_id set, status 'ready') are fetched with GET;
+ * exports that were ready immediately are streamed by POSTing the same
+ * request that was passed to prepareLogExport.
  */
-export async function downloadLogExport(downloadUrl: string): Promise<Blob> {
-  const response = await client.get(downloadUrl, {
+export async function downloadLogExport(
+  exportInfo: LogExportResponse,
+  request: LogExportRequest = {}
+): Promise<Blob> {
+  if (!exportInfo.job_id) {
+    return exportLogs(request)
+  }
+  const response = await client.get(`/v1/reel/logs/export/${exportInfo.job_id}/download`, {
     responseType: 'blob',
   })
   return response.data
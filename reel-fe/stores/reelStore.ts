@@ -14,15 +14,19 @@ import type {
   LogFilter,
   LogQueryParams,
   LogExportRequest,
-  LogExportResponse,
 } from '../types'
 import {
   fetchLogs,
   fetchLog,
   fetchLogStats,
-  exportLogs,
+  prepareLogExport,
+  fetchLogExportJob,
+  downloadLogExport,
 } from '../services/reel-api'
 
+// Delay between status polls of a background export
+const EXPORT_POLL_INTERVAL_MS = 1000
+
 export const useReelStore = defineStore('reel', () => {
   // ============================================================================
   // STATE
@@ -32,11 +36,14 @@ export const useReelStore = defineStore('reel', () => {
   const logs = ref<LogEntry[]>([])
   const currentLog = ref<LogEntry | null>(null)
 
-  // Pagination
-  const totalLogs = ref(0)
+  // Pagination (totals are null when unknown: filtered lists and cursor
+  // pages come without a count; unfiltered counts are estimates)
+  const totalLogs = ref<number | null>(null)
+  const totalEstimated = ref(false)
   const currentPage = ref(1)
   const pageSize = ref(50)
-  const totalPages = ref(0)
+  const totalPages = ref<number | null>(null)
+  const hasMore = ref(false)
 
   // Filter state
   const filter = ref<LogFilter>({})
@@ -57,7 +64,7 @@ export const useReelStore = defineStore('reel', () => {
   // ============================================================================
 
   const hasLogs = computed(() => logs.value.length > 0)
-  const hasMorePages = computed(() => currentPage.value < totalPages.value)
+  const hasMorePages = computed(() => hasMore.value)
   const hasPreviousPage = computed(() => currentPage.value > 1)
 
   const activeFiltersCount = computed(() => {
@@ -93,8 +100,10 @@ export const useReelStore = defineStore('reel', () => {
       const result = await fetchLogs(params)
       logs.value = result.items
       totalLogs.value = result.total
+      totalEstimated.value = result.total_estimated
       totalPages.value = result.pages
-      currentPage.value = result.page
+      hasMore.value = result.has_more
+      currentPage.value = result.page ?? currentPage.value
       pageSize.value = result.page_size
     } catch (e) {
       error.value = e instanceof Error ? e.message : 'Failed to load logs'
@@ -146,7 +155,7 @@ export const useReelStore = defineStore('reel', () => {
   async function exportCurrentLogs(
     format: 'csv' | 'json' = 'csv',
     includeData = false
-  ): Promise<LogExportResponse> {
+  ): Promise<Blob> {
     const request: LogExportRequest = {
       filter: hasActiveFilters.value ? filter.value : undefined,
       format,
@@ -157,8 +166,16 @@ export const useReelStore = defineStore('reel', () => {
     error.value = null
 
     try {
-      const result = await exportLogs(request)
-      return result
+      // Large exports run as background jobs: wait until the file is ready
+      let exportInfo = await prepareLogExport(request)
+      while (exportInfo.job_id && exportInfo.status === 'pending') {
+        await new Promise((resolve) => setTimeout(resolve, EXPORT_POLL_INTERVAL_MS))
+        exportInfo = await fetchLogExportJob(exportInfo.job_id)
+      }
+      if (exportInfo.status === 'failed') {
+        throw new Error('Failed to export logs')
+      }
+      return await downloadLogExport(exportInfo, request)
     } catch (e) {
       error.value = e instanceof Error ? e.message : 'Failed to export logs'
       throw e
@@ -191,7 +208,10 @@ export const useReelStore = defineStore('reel', () => {
    * Go to specific page
    */
   async function goToPage(page: number): Promise<void> {
-    if (page >= 1 && page <= totalPages.value) {
+    // Without a total, only pages up to the next one are known to exist
+    const lastPage =
+      totalPages.value ?? (hasMore.value ? currentPage.value + 1 : currentPage.value)
+    if (page >= 1 && page <= lastPage) {
       currentPage.value = page
       await loadLogs()
     }
@@ -253,10 +273,12 @@ export const useReelStore = defineStore('reel', () => {
   function $reset(): void {
     logs.value = []
     currentLog.value = null
-    totalLogs.value = 0
+    totalLogs.value = null
+    totalEstimated.value = false
     currentPage.value = 1
     pageSize.value = 50
-    totalPages.value = 0
+    totalPages.value = null
+    hasMore.value = false
     filter.value = {}
     stats.value = null
     isLoading.value = false
@@ -274,6 +296,7 @@ export const useReelStore = defineStore('reel', () => {
     logs,
     currentLog,
     totalLogs,
+    totalEstimated,
     currentPage,
     pageSize,
     totalPages,
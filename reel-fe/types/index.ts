@@ -43,18 +43,25 @@ export interface LogFilter {
   resource_type?: string
   resource_id?: string
   client_id?: string
+  data_contains?: Record<string, unknown>
   search?: string
 }
 
 /**
  * Paginated list of log entries
+ *
+ * Cursor pages (next_cursor) omit total, page and pages. Page-number
+ * requests omit total for filtered lists unless exact_total is set.
  */
 export interface LogEntryList {
   items: LogEntry[]
-  total: number
-  page: number
+  total: number | null
+  total_estimated: boolean
+  page: number | null
   page_size: number
-  pages: number
+  pages: number | null
+  has_more: boolean
+  next_cursor: string | null
 }
 
 /**
@@ -77,6 +84,11 @@ export interface LogExportRequest {
   include_data?: boolean
 }
 
+/**
+ * Log export state (large exports run as background jobs)
+ */
+export type ExportStatus = 'pending' | 'ready' | 'failed'
+
 /**
  * Response for log export
  */
@@ -85,6 +97,8 @@ export interface LogExportResponse {
   filename: string
   record_count: number
   expires_at: string
+  status: ExportStatus
+  job_id: string | null
 }
 
 /**
@@ -103,8 +117,11 @@ export interface LogEntryCreate {
  * Pagination parameters
  */
 export interface PaginationParams {
+  /** @deprecated Use cursor */
   page?: number
   page_size?: number
+  cursor?: string
+  exact_total?: boolean
 }
 
 /**